@@ -71,6 +71,10 @@ async def get_current_user(
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
     """Get current authenticated user"""
+    return await authenticate_token(token, db)
+
+async def authenticate_token(token: str, db: AsyncIOMotorDatabase) -> UserResponse:
+    """Resolve a JWT access token to its user"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
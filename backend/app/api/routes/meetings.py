@@ -11,10 +11,19 @@ from app.models.meeting import Meeting, MeetingCreate, MeetingUpdate, MeetingRes
 from app.models.user import UserResponse
 from app.api.routes.auth import get_current_user
 from app.core.config import settings
+from app.core.executors import occupied, transcription_executor, summarization_executor, action_extraction_executor
+from app.ml.audio import prepare_audio, remove_decoded
+from app.services.transcription import TranscriptionInProgress, transcribe_meeting_audio
+from app.services.summarization import summarize_meeting_transcript
+from app.services.action_items import extract_meeting_action_items
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
+import asyncio
+import logging
+import time
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 UPLOAD_DIR = "uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
@@ -79,6 +88,8 @@ async def create_meeting(
     
     # Start background processing if audio file was uploaded
     if audio_file_path:
+        # Decode once up front so every transcription attempt reuses the same samples
+        background_tasks.add_task(prepare_audio, audio_file_path)
         background_tasks.add_task(process_meeting_audio, str(result.inserted_id), audio_file_path, db)
     
     return MeetingResponse(**created_meeting)
@@ -172,6 +183,8 @@ async def delete_meeting(
     # Delete audio file if exists
     if meeting.get("audio_file_path") and os.path.exists(meeting["audio_file_path"]):
         os.remove(meeting["audio_file_path"])
+    if meeting.get("audio_file_path"):
+        remove_decoded(meeting["audio_file_path"])
     
     # Delete meeting and associated action items
     await db["meetings"].delete_one({"_id": ObjectId(meeting_id)})
@@ -180,41 +193,72 @@ async def delete_meeting(
     return {"message": "Meeting deleted successfully"}
 
 async def process_meeting_audio(meeting_id: str, audio_file_path: str, db: AsyncIOMotorDatabase):
-    """Background task to process audio file"""
+    """
+    Background task that takes an uploaded meeting from audio to results
+    
+    Transcription runs first. Summarization and action item extraction then run
+    concurrently on the transcript. Each stage sets its own status and timing, so a
+    failed stage can be retried through its own endpoint without redoing the others.
+    """
+    started = time.perf_counter()
+    meeting = await db["meetings"].find_one({"_id": ObjectId(meeting_id)})
+    if meeting is None:
+        # Deleted before processing started
+        return
+    
     try:
-        # Update status to processing
+        with occupied(transcription_executor):
+            await transcribe_meeting_audio(db, meeting)
+    except TranscriptionInProgress:
+        # A manual run got there first and owns the rest of the work
+        logger.info(f"Meeting {meeting_id} is already being transcribed, leaving it to that run")
+        return
+    except Exception:
+        logger.warning(f"Processing of meeting {meeting_id} stopped after transcription failed")
         await db["meetings"].update_one(
             {"_id": ObjectId(meeting_id)},
-            {"$set": {
-                "transcription_status": "processing",
-                "updated_at": datetime.utcnow()
-            }}
+            {"$set": {"updated_at": datetime.utcnow()}}
         )
+        return
+    
+    meeting = await db["meetings"].find_one({"_id": ObjectId(meeting_id)})
+    if meeting is None:
+        return
+    
+    if meeting.get("transcript"):
+        async def summarize():
+            # Same fallback as the summarization routes when the abstractive queue is full
+            overflow = settings.SUMMARIZATION_EXTRACTIVE_FALLBACK and summarization_executor.saturated
+            with occupied(summarization_executor):
+                await summarize_meeting_transcript(
+                    db, meeting, mode="extractive" if overflow else "abstractive"
+                )
         
-        # This would integrate with the ML services
-        # For now, we'll just mark as completed
-        # In a real implementation, this would:
-        # 1. Call transcription service
-        # 2. Call summarization service  
-        # 3. Call action item extraction service
+        async def extract():
+            mode = "segments" if meeting.get("transcript_segments") else "transcript"
+            with occupied(action_extraction_executor):
+                await extract_meeting_action_items(db, meeting, mode)
         
+        # Failures are recorded on the meeting by each stage
+        await asyncio.gather(summarize(), extract(), return_exceptions=True)
+    else:
+        # Nothing to summarize or extract, so both stages are done with empty results
+        logger.info(f"Meeting {meeting_id} has no speech, skipping summarization and action items")
         await db["meetings"].update_one(
             {"_id": ObjectId(meeting_id)},
             {"$set": {
-                "transcription_status": "completed",
-                "summarization_status": "completed", 
-                "action_extraction_status": "completed",
-                "processed_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
+                "summary": "",
+                "summarization_status": "completed",
+                "action_items_count": 0,
+                "action_extraction_status": "completed"
             }}
         )
-        
-    except Exception as e:
-        # Update status to failed
-        await db["meetings"].update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": {
-                "transcription_status": "failed",
-                "updated_at": datetime.utcnow()
-            }}
-        )
\ No newline at end of file
+    
+    await db["meetings"].update_one(
+        {"_id": ObjectId(meeting_id)},
+        {"$set": {
+            "processed_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+            "processing_timings.total": round(time.perf_counter() - started, 3)
+        }}
+    )
\ No newline at end of file
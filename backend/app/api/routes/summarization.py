@@ -1,28 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from app.core.database import get_database
 from app.models.user import UserResponse
 from app.api.routes.auth import get_current_user
-from app.ml.summarization import summarizer
+from app.core.config import settings
+from app.core.executors import admission, occupied, reject_if_saturated, summarization_executor
+from app.ml.summarization import summarizer, MeetingSummarizer
+from app.services.summarization import summarize_meeting_transcript
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
+import asyncio
+import json
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Streamed summarizations in progress
+_running = set()
+
+def validate_mode(mode: str):
+    """Reject unknown summarization modes"""
+    if mode not in MeetingSummarizer.MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid summarization mode. Allowed: {', '.join(MeetingSummarizer.MODES)}"
+        )
+
+def fallback_mode(mode: str, admitted: bool) -> str:
+    """Serve an extractive summary when the abstractive queue is full"""
+    if not admitted and mode == "abstractive":
+        logger.info("Summarization queue is full, falling back to extractive mode")
+        return "extractive"
+    return mode
+
 @router.post("/summarize/{meeting_id}")
 async def summarize_meeting(
     meeting_id: str,
+    response: Response,
     max_length: int = 150,
     min_length: int = 50,
+    mode: str = "abstractive",
+    incremental: bool = False,
     current_user: UserResponse = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    admitted: bool = Depends(admission(summarization_executor, overflow=settings.SUMMARIZATION_EXTRACTIVE_FALLBACK))
 ):
     """Generate summary for a specific meeting"""
     
     if not ObjectId.is_valid(meeting_id):
         raise HTTPException(status_code=400, detail="Invalid meeting ID")
     
+    validate_mode(mode)
+    mode = fallback_mode(mode, admitted)
+    
     # Get meeting
     meeting = await db["meetings"].find_one({
         "_id": ObjectId(meeting_id),
@@ -36,56 +67,119 @@ async def summarize_meeting(
         raise HTTPException(status_code=400, detail="No transcript available. Please transcribe the meeting first.")
     
     try:
-        # Update status to processing
-        await db["meetings"].update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": {"summarization_status": "processing"}}
-        )
-        
-        # Perform summarization
-        result = await summarizer.summarize_transcript(
-            meeting["transcript"],
+        result = await summarize_meeting_transcript(
+            db,
+            meeting,
             max_length=max_length,
-            min_length=min_length
+            min_length=min_length,
+            mode=mode,
+            incremental=incremental
         )
         
-        # Update meeting with summary
-        await db["meetings"].update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": {
-                "summary": result["summary"],
-                "summary_stats": result,
-                "summarization_status": "completed"
-            }}
-        )
+        response.headers["X-Summary-Cache"] = "HIT" if result["cached"] else "MISS"
         
         return {
             "message": "Summarization completed successfully",
             "summary": result["summary"],
+            "mode": result["mode"],
             "stats": {
                 "original_length": result["original_length"],
                 "summary_length": result["summary_length"],
-                "compression_ratio": result["compression_ratio"]
+                "compression_ratio": result["compression_ratio"],
+                "levels": result.get("levels", []),
+                "timings": result["timings"]
             }
         }
-        
+    
     except Exception as e:
-        logger.error(f"Summarization failed for meeting {meeting_id}: {str(e)}")
-        
-        # Update status to failed
-        await db["meetings"].update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": {"summarization_status": "failed"}}
-        )
-        
         raise HTTPException(status_code=500, detail=f"Summarization failed: {str(e)}")
 
+@router.post("/summarize/{meeting_id}/stream")
+async def stream_meeting_summary(
+    meeting_id: str,
+    max_length: int = 150,
+    min_length: int = 50,
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Generate summary for a specific meeting, streaming progress as server-sent events
+    
+    Emits "chunks" with the chunk count, "summary" for each chunk and reduce-group
+    summary as it is generated, "level" when a level of the tree completes and finally
+    "completed" with the full result or "error". The result is saved to the meeting
+    even if the client disconnects early, and the summarization slot is held until
+    then rather than until the stream closes.
+    """
+    
+    reject_if_saturated(summarization_executor)
+    
+    if not ObjectId.is_valid(meeting_id):
+        raise HTTPException(status_code=400, detail="Invalid meeting ID")
+    
+    meeting = await db["meetings"].find_one({
+        "_id": ObjectId(meeting_id),
+        "user_id": ObjectId(current_user.id)
+    })
+    
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    if not meeting.get("transcript"):
+        raise HTTPException(status_code=400, detail="No transcript available. Please transcribe the meeting first.")
+    
+    await db["meetings"].update_one(
+        {"_id": ObjectId(meeting_id)},
+        {"$set": {"summarization_status": "processing"}}
+    )
+    
+    events = asyncio.Queue()
+    
+    async def on_progress(event: str, data: dict):
+        await events.put((event, data))
+    
+    async def run():
+        try:
+            with occupied(summarization_executor):
+                result = await summarize_meeting_transcript(
+                    db,
+                    meeting,
+                    max_length=max_length,
+                    min_length=min_length,
+                    on_progress=on_progress
+                )
+            await events.put(("completed", result))
+        
+        except Exception as e:
+            await events.put(("error", {"detail": str(e)}))
+    
+    # Keep a reference so the run survives the client going away
+    task = asyncio.create_task(run())
+    _running.add(task)
+    task.add_done_callback(_running.discard)
+    
+    async def stream():
+        while True:
+            event, data = await events.get()
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+            if event in ("completed", "error"):
+                break
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/summarize-text")
 async def summarize_text(
     text: str,
+    response: Response,
     max_length: int = 150,
     min_length: int = 50,
-    current_user: UserResponse = Depends(get_current_user)
+    mode: str = "abstractive",
+    current_user: UserResponse = Depends(get_current_user),
+    admitted: bool = Depends(admission(summarization_executor, overflow=settings.SUMMARIZATION_EXTRACTIVE_FALLBACK))
 ):
     """Summarize provided text"""
     
@@ -95,27 +189,43 @@ async def summarize_text(
     if len(text.split()) < 50:
         raise HTTPException(status_code=400, detail="Text too short for meaningful summarization")
     
+    validate_mode(mode)
+    mode = fallback_mode(mode, admitted)
+    
     try:
         result = await summarizer.summarize_transcript(
             text,
             max_length=max_length,
-            min_length=min_length
+            min_length=min_length,
+            mode=mode
         )
+        response.headers["X-Summary-Cache"] = "HIT" if result["cached"] else "MISS"
         
         return {
             "message": "Summarization completed successfully",
             "summary": result["summary"],
+            "mode": result["mode"],
             "stats": {
                 "original_length": result["original_length"],
                 "summary_length": result["summary_length"],
                 "compression_ratio": result["compression_ratio"]
             }
         }
-        
+    
     except Exception as e:
         logger.error(f"Text summarization failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Summarization failed: {str(e)}")
 
+@router.get("/cache/stats")
+async def get_summary_cache_stats(
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """Get summary cache hit/miss counters"""
+    if summarizer.cache is None:
+        return {"enabled": False}
+    
+    return {"enabled": True, **summarizer.cache.stats()}
+
 @router.get("/{meeting_id}/summary")
 async def get_summary(
     meeting_id: str,
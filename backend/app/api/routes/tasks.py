@@ -1,29 +1,56 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
 from app.core.database import get_database
 from app.models.user import UserResponse
-from app.models.action_item import ActionItem, ActionItemCreate, ActionItemUpdate, ActionItemResponse
+from app.models.action_item import ActionItemCreate, ActionItemUpdate, ActionItemResponse
 from app.api.routes.auth import get_current_user
-from app.ml.action_extraction import action_extractor
+from app.core.config import settings
+from app.core.executors import admission, action_extraction_executor
+from app.ml.action_extraction import action_extractor, ActionItemExtractor
+from app.ml.dates import resolve_due_date
+from app.ml.dedup import band_keys, minhash
+from app.services.action_items import (
+    extract_meeting_action_items, extract_bulk, pending_meetings_query, OPEN_STATUSES
+)
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
+import os
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+def as_utc(value: datetime) -> datetime:
+    """Naive UTC datetime, as stored in MongoDB"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
 @router.post("/extract/{meeting_id}")
 async def extract_action_items(
     meeting_id: str,
+    mode: str = "transcript",
     current_user: UserResponse = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    _slot: bool = Depends(admission(action_extraction_executor))
 ):
-    """Extract action items from meeting transcript"""
+    """
+    Extract action items from meeting transcript
+    
+    In segments mode the stored transcript segments are used instead of the flat
+    transcript and each action item gets the start and end of where it was said.
+    """
     
     if not ObjectId.is_valid(meeting_id):
         raise HTTPException(status_code=400, detail="Invalid meeting ID")
     
+    if mode not in ActionItemExtractor.MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid extraction mode. Allowed: {', '.join(ActionItemExtractor.MODES)}"
+        )
+    
     # Get meeting
     meeting = await db["meetings"].find_one({
         "_id": ObjectId(meeting_id),
@@ -36,42 +63,12 @@ async def extract_action_items(
     if not meeting.get("transcript"):
         raise HTTPException(status_code=400, detail="No transcript available. Please transcribe the meeting first.")
     
+    if mode == "segments" and not meeting.get("transcript_segments"):
+        raise HTTPException(status_code=400, detail="No transcript segments available for this meeting")
+    
     try:
-        # Update status to processing
-        await db["meetings"].update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": {"action_extraction_status": "processing"}}
-        )
-        
-        # Extract action items
-        extracted_items = await action_extractor.extract_action_items(meeting["transcript"])
-        
-        # Save action items to database
-        action_items = []
-        for item in extracted_items:
-            action_item = ActionItem(
-                meeting_id=ObjectId(meeting_id),
-                user_id=ObjectId(current_user.id),
-                text=item["text"],
-                assignees=item["assignees"],
-                due_date=item["due_date"],
-                organizations=item["organizations"],
-                confidence=item["confidence"],
-                extracted_at=datetime.fromisoformat(item["extracted_at"])
-            )
-            
-            result = await db["action_items"].insert_one(action_item.dict(by_alias=True))
-            saved_item = await db["action_items"].find_one({"_id": result.inserted_id})
-            action_items.append(ActionItemResponse(**saved_item))
-        
-        # Update meeting with action items count
-        await db["meetings"].update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": {
-                "action_items_count": len(action_items),
-                "action_extraction_status": "completed"
-            }}
-        )
+        saved_items = await extract_meeting_action_items(db, meeting, mode)
+        action_items = [ActionItemResponse(**item) for item in saved_items]
         
         return {
             "message": f"Extracted {len(action_items)} action items successfully",
@@ -79,20 +76,52 @@ async def extract_action_items(
         }
         
     except Exception as e:
-        logger.error(f"Action item extraction failed for meeting {meeting_id}: {str(e)}")
-        
-        # Update status to failed
-        await db["meetings"].update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": {"action_extraction_status": "failed"}}
+        raise HTTPException(status_code=500, detail=f"Action item extraction failed: {str(e)}")
+
+@router.post("/extract-bulk")
+async def extract_action_items_bulk(
+    meeting_ids: Optional[List[str]] = Query(None),
+    batch_size: int = settings.ACTION_EXTRACTION_PIPE_BATCH_SIZE,
+    n_process: int = settings.ACTION_EXTRACTION_PIPE_PROCESSES,
+    current_user: UserResponse = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    _slot: bool = Depends(admission(action_extraction_executor))
+):
+    """
+    Extract action items for all of the user's meetings that have a transcript but no
+    extracted action items yet, or only for meeting_ids when given
+    """
+    
+    if meeting_ids is not None:
+        if not all(ObjectId.is_valid(meeting_id) for meeting_id in meeting_ids):
+            raise HTTPException(status_code=400, detail="Invalid meeting ID")
+        meeting_ids = [ObjectId(meeting_id) for meeting_id in meeting_ids]
+    
+    if batch_size < 1:
+        raise HTTPException(status_code=400, detail="batch_size must be at least 1")
+    n_process = max(1, min(n_process, os.cpu_count() or 1))
+    
+    try:
+        stats = await extract_bulk(
+            db,
+            pending_meetings_query(ObjectId(current_user.id), meeting_ids),
+            batch_size=batch_size,
+            n_process=n_process
         )
-        
+    except Exception as e:
+        logger.error(f"Bulk action item extraction failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Action item extraction failed: {str(e)}")
+    
+    return {
+        "message": f"Extracted {stats['action_items']} action items from {stats['meetings']} meetings",
+        "stats": stats
+    }
 
 @router.post("/extract-text")
 async def extract_action_items_from_text(
     text: str,
-    current_user: UserResponse = Depends(get_current_user)
+    current_user: UserResponse = Depends(get_current_user),
+    _slot: bool = Depends(admission(action_extraction_executor))
 ):
     """Extract action items from provided text"""
     
@@ -143,18 +172,42 @@ async def get_meeting_action_items(
 @router.get("/", response_model=List[ActionItemResponse])
 async def get_user_action_items(
     status: str = None,
+    due_before: Optional[datetime] = None,
+    due_after: Optional[datetime] = None,
+    overdue: bool = False,
     skip: int = 0,
     limit: int = 50,
     current_user: UserResponse = Depends(get_current_user),
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
-    """Get user's action items with optional status filter"""
+    """
+    Get user's action items with optional status and due date filters
+    
+    Due date filters match on the resolved due_at and return the soonest due first.
+    overdue only returns open items unless a status is given.
+    """
     
     query = {"user_id": ObjectId(current_user.id)}
     if status:
         query["status"] = status
     
-    cursor = db["action_items"].find(query).sort("created_at", -1).skip(skip).limit(limit)
+    due_range = {}
+    if due_after:
+        due_range["$gte"] = as_utc(due_after)
+    if due_before:
+        due_range["$lt"] = as_utc(due_before)
+    if overdue:
+        now = datetime.utcnow()
+        due_range["$lt"] = min(due_range.get("$lt", now), now)
+        if not status:
+            query["status"] = {"$in": OPEN_STATUSES}
+    
+    if due_range:
+        # Served by the (user_id, due_at) and (user_id, status, due_at) indexes
+        query["due_at"] = due_range
+        cursor = db["action_items"].find(query).sort("due_at", 1).skip(skip).limit(limit)
+    else:
+        cursor = db["action_items"].find(query).sort("created_at", -1).skip(skip).limit(limit)
     action_items = await cursor.to_list(length=limit)
     
     return [ActionItemResponse(**item) for item in action_items]
@@ -184,6 +237,18 @@ async def update_action_item(
     update_dict = update_data.dict(exclude_unset=True)
     update_dict["updated_at"] = datetime.utcnow()
     
+    # Keep the near-duplicate signature in line with the text
+    if update_dict.get("text"):
+        update_dict["minhash"] = minhash(update_dict["text"])
+        update_dict["lsh_bands"] = band_keys(update_dict["minhash"])
+    
+    # An edited due date is taken relative to when it was edited
+    if "due_date" in update_dict:
+        update_dict["due_at"] = (
+            resolve_due_date(update_dict["due_date"], update_dict["updated_at"])
+            if update_dict["due_date"] else None
+        )
+    
     # Set completion date if status changed to completed
     if update_dict.get("status") == "completed" and existing_item["status"] != "completed":
         update_dict["completed_at"] = datetime.utcnow()
@@ -1,10 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, WebSocket
+from typing import Optional
 from app.core.database import get_database
 from app.models.user import UserResponse
-from app.api.routes.auth import get_current_user
-from app.ml.transcription import transcriber
+from app.api.routes.auth import get_current_user, authenticate_token
+from app.core.executors import admission, transcription_executor
+from app.ml.transcription import transcriber, transcriber_registry, StreamingTranscription
+from app.ml.audio import audio_duration, remove_decoded
+from app.services.transcription import TranscriptionInProgress, transcribe_meeting_audio
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from bson import ObjectId
+from datetime import datetime
+import numpy as np
+import asyncio
 import os
 import tempfile
 import logging
@@ -12,11 +19,21 @@ import logging
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+def validate_quality(quality: Optional[str]):
+    """Reject quality tiers that are not configured"""
+    if quality is not None and quality not in transcriber_registry.tiers:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid quality tier. Allowed: {', '.join(transcriber_registry.tiers)}"
+        )
+
 @router.post("/transcribe/{meeting_id}")
 async def transcribe_meeting(
     meeting_id: str,
+    quality: Optional[str] = None,
     current_user: UserResponse = Depends(get_current_user),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    _slot: bool = Depends(admission(transcription_executor))
 ):
     """Transcribe audio for a specific meeting"""
     
@@ -38,49 +55,28 @@ async def transcribe_meeting(
     if not os.path.exists(meeting["audio_file_path"]):
         raise HTTPException(status_code=400, detail="Audio file not found on disk")
     
+    validate_quality(quality)
+    
     try:
-        # Update status to processing
-        await db["meetings"].update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": {"transcription_status": "processing"}}
-        )
-        
-        # Perform transcription
-        result = await transcriber.transcribe_audio(meeting["audio_file_path"])
-        
-        # Update meeting with transcription results
-        await db["meetings"].update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": {
-                "transcript": result["text"],
-                "transcript_segments": result["segments"],
-                "transcript_language": result["language"],
-                "transcription_status": "completed"
-            }}
-        )
+        result = await transcribe_meeting_audio(db, meeting, quality)
         
         return {
             "message": "Transcription completed successfully",
-            "transcript": result["text"],
-            "language": result["language"],
-            "segments": result["segments"]
+            **result
         }
-        
+    
+    except TranscriptionInProgress:
+        raise HTTPException(status_code=409, detail="Transcription already in progress for this meeting")
+    
     except Exception as e:
-        logger.error(f"Transcription failed for meeting {meeting_id}: {str(e)}")
-        
-        # Update status to failed
-        await db["meetings"].update_one(
-            {"_id": ObjectId(meeting_id)},
-            {"$set": {"transcription_status": "failed"}}
-        )
-        
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
 @router.post("/transcribe-file")
 async def transcribe_audio_file(
     audio_file: UploadFile = File(...),
-    current_user: UserResponse = Depends(get_current_user)
+    quality: Optional[str] = None,
+    current_user: UserResponse = Depends(get_current_user),
+    _slot: bool = Depends(admission(transcription_executor))
 ):
     """Transcribe uploaded audio file without saving meeting"""
     
@@ -94,6 +90,8 @@ async def transcribe_audio_file(
             detail=f"Invalid audio format. Allowed: {', '.join(allowed_formats)}"
         )
     
+    validate_quality(quality)
+    
     try:
         # Save uploaded file temporarily
         with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_extension}") as temp_file:
@@ -101,28 +99,159 @@ async def transcribe_audio_file(
             temp_file.write(content)
             temp_path = temp_file.name
         
+        loop = asyncio.get_event_loop()
+        duration = await loop.run_in_executor(None, audio_duration, temp_path)
+        model = transcriber_registry.route(duration, quality)
+        
         # Perform transcription
-        result = await transcriber.transcribe_audio(temp_path)
+        result = await model.transcribe_audio(temp_path)
         
         # Clean up temporary file
         os.unlink(temp_path)
+        remove_decoded(temp_path)
         
         return {
             "message": "Transcription completed successfully",
             "transcript": result["text"],
             "language": result["language"],
-            "segments": result["segments"]
+            "model": model.name,
+            "segments": result["segments"],
+            "skipped_fraction": result["skipped_fraction"],
+            "cached": result["cached"]
         }
-        
+    
     except Exception as e:
         logger.error(f"File transcription failed: {str(e)}")
         
         # Clean up temporary file if it exists
         if 'temp_path' in locals() and os.path.exists(temp_path):
             os.unlink(temp_path)
+        if 'temp_path' in locals():
+            remove_decoded(temp_path)
         
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
+@router.websocket("/stream/{meeting_id}")
+async def stream_transcription(
+    websocket: WebSocket,
+    meeting_id: str,
+    token: str,
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Transcribe a meeting while its audio is being streamed
+    
+    The client authenticates with ?token=<access token>, sends binary frames of
+    16 kHz mono 16-bit little-endian PCM and sends the text message "stop" when done.
+    Finalized segments are pushed back as {"type": "segment", ...} messages and the full
+    transcript is saved to the meeting when the stream closes.
+    """
+    try:
+        current_user = await authenticate_token(token, db)
+    except HTTPException:
+        await websocket.close(code=1008)
+        return
+    
+    if not ObjectId.is_valid(meeting_id):
+        await websocket.close(code=1008)
+        return
+    
+    meeting = await db["meetings"].find_one({
+        "_id": ObjectId(meeting_id),
+        "user_id": ObjectId(current_user.id)
+    })
+    
+    if not meeting:
+        await websocket.close(code=1008)
+        return
+    
+    await websocket.accept()
+    await db["meetings"].update_one(
+        {"_id": ObjectId(meeting_id)},
+        {"$set": {"transcription_status": "processing"}}
+    )
+    
+    session = StreamingTranscription(transcriber)
+    connected = True
+    leftover = b""  # odd trailing byte of a frame, completed by the next one
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                connected = False
+                break
+            
+            if message.get("bytes"):
+                # Frames may split a sample; carry its first byte over to the next frame
+                data = leftover + message["bytes"]
+                usable = len(data) - len(data) % 2
+                leftover = data[usable:]
+                samples = np.frombuffer(data[:usable], dtype="<i2").astype(np.float32) / 32768.0
+                session.add_audio(samples)
+                
+                if session.ready():
+                    for segment in await session.process():
+                        await websocket.send_json({"type": "segment", **segment})
+            elif message.get("text") == "stop":
+                break
+        
+        # Whatever is still buffered becomes final when the stream ends
+        final_segments = await session.process(final=True)
+        if connected:
+            for segment in final_segments:
+                await websocket.send_json({"type": "segment", **segment})
+        
+        await db["meetings"].update_one(
+            {"_id": ObjectId(meeting_id)},
+            {"$set": {
+                "transcript": session.text,
+                "transcript_segments": session.segments,
+                "transcript_language": session.language,
+                "transcription_model": transcriber.name,
+                "duration": session.duration,
+                "transcription_status": "completed",
+                "updated_at": datetime.utcnow()
+            }}
+        )
+        
+        if connected:
+            await websocket.send_json({
+                "type": "completed",
+                "transcript": session.text,
+                "language": session.language
+            })
+            await websocket.close()
+    
+    except Exception as e:
+        logger.error(f"Streaming transcription failed for meeting {meeting_id}: {str(e)}")
+        
+        # Keep the segments finalized before the failure
+        await db["meetings"].update_one(
+            {"_id": ObjectId(meeting_id)},
+            {"$set": {
+                "transcript": session.text,
+                "transcript_segments": session.segments,
+                "transcript_language": session.language,
+                "transcription_model": transcriber.name,
+                "transcription_status": "failed",
+                "updated_at": datetime.utcnow()
+            }}
+        )
+        
+        if connected:
+            await websocket.close(code=1011)
+
+@router.get("/cache/stats")
+async def get_transcription_cache_stats(
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """Get transcription cache hit/miss counters"""
+    if transcriber.cache is None:
+        return {"enabled": False}
+    
+    return {"enabled": True, **transcriber.cache.stats()}
+
 @router.get("/{meeting_id}/transcript")
 async def get_transcript(
     meeting_id: str,
@@ -142,12 +271,21 @@ async def get_transcript(
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    if not meeting.get("transcript"):
+    segments = meeting.get("transcript_segments") or []
+    in_progress = meeting.get("transcription_status") in ("processing", "failed")
+    
+    if not meeting.get("transcript") and not (in_progress and segments):
         raise HTTPException(status_code=404, detail="Transcript not available")
     
+    # While a run is underway the checkpointed segments are the freshest transcript
+    transcript = meeting.get("transcript")
+    if in_progress and segments:
+        transcript = "".join(segment["text"] for segment in segments).strip()
+    
     return {
-        "transcript": meeting["transcript"],
-        "segments": meeting.get("transcript_segments", []),
+        "transcript": transcript,
+        "segments": segments,
         "language": meeting.get("transcript_language"),
-        "status": meeting.get("transcription_status")
+        "status": meeting.get("transcription_status"),
+        "transcribed_until": meeting.get("transcription_offset")
     }
\ No newline at end of file
@@ -36,6 +36,59 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
     ALLOWED_AUDIO_FORMATS: List[str] = ["wav", "mp3", "m4a", "flac", "aac"]
     
+    # Transcription settings
+    TRANSCRIPTION_CHUNK_WORKERS: int = int(os.getenv("TRANSCRIPTION_CHUNK_WORKERS", "2"))
+    TRANSCRIPTION_CHUNK_SECONDS: float = float(os.getenv("TRANSCRIPTION_CHUNK_SECONDS", "300"))
+    TRANSCRIPTION_CHUNKED_MIN_SECONDS: float = float(os.getenv("TRANSCRIPTION_CHUNKED_MIN_SECONDS", "600"))
+    TRANSCRIPTION_CACHE_DIR: str = os.getenv("TRANSCRIPTION_CACHE_DIR", "cache/transcriptions")
+    TRANSCRIPTION_CACHE_MAX_BYTES: int = int(os.getenv("TRANSCRIPTION_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+    TRANSCRIPTION_VAD_ENABLED: bool = os.getenv("TRANSCRIPTION_VAD_ENABLED", "true").lower() == "true"
+    TRANSCRIPTION_VAD_MIN_SPEECH_FRACTION: float = float(os.getenv("TRANSCRIPTION_VAD_MIN_SPEECH_FRACTION", "0.02"))  # below this the whole audio is transcribed
+    TRANSCRIPTION_BATCHING_ENABLED: bool = os.getenv("TRANSCRIPTION_BATCHING_ENABLED", "false").lower() == "true"
+    TRANSCRIPTION_BATCH_SIZE: int = int(os.getenv("TRANSCRIPTION_BATCH_SIZE", "8"))
+    TRANSCRIPTION_BATCH_MAX_WAIT_MS: float = float(os.getenv("TRANSCRIPTION_BATCH_MAX_WAIT_MS", "50"))
+    TRANSCRIPTION_MODEL_TIERS: str = os.getenv("TRANSCRIPTION_MODEL_TIERS", "fast=base-int8,balanced=base,accurate=small")
+    TRANSCRIPTION_SHORT_SECONDS: float = float(os.getenv("TRANSCRIPTION_SHORT_SECONDS", "120"))
+    TRANSCRIPTION_LONG_SECONDS: float = float(os.getenv("TRANSCRIPTION_LONG_SECONDS", "3600"))
+    TRANSCRIPTION_BUSY_QUEUE_DEPTH: int = int(os.getenv("TRANSCRIPTION_BUSY_QUEUE_DEPTH", "4"))
+    TRANSCRIPTION_LEASE_SECONDS: float = float(os.getenv("TRANSCRIPTION_LEASE_SECONDS", "120"))  # a run without a heartbeat for this long is abandoned
+    
+    # Summarization settings
+    SUMMARIZATION_BACKEND: str = os.getenv("SUMMARIZATION_BACKEND", "torch")  # torch, torch-int8, onnx
+    SUMMARIZATION_MODEL_DIR: str = os.getenv("SUMMARIZATION_MODEL_DIR", "")  # local model files; empty downloads from the Hub
+    SUMMARIZATION_ONNX_DIR: str = os.getenv("SUMMARIZATION_ONNX_DIR", "models/summarization-onnx")
+    SUMMARIZATION_CHUNK_TOKENS: int = int(os.getenv("SUMMARIZATION_CHUNK_TOKENS", "1024"))
+    SUMMARIZATION_CHUNK_OVERLAP: int = int(os.getenv("SUMMARIZATION_CHUNK_OVERLAP", "0"))
+    SUMMARIZATION_BATCH_SIZE: int = int(os.getenv("SUMMARIZATION_BATCH_SIZE", "8"))
+    SUMMARIZATION_BATCH_MAX_TOKENS: int = int(os.getenv("SUMMARIZATION_BATCH_MAX_TOKENS", "8192"))  # padded input + output tokens per forward pass
+    SUMMARIZATION_BATCH_MAX_WAIT_MS: float = float(os.getenv("SUMMARIZATION_BATCH_MAX_WAIT_MS", "20"))
+    SUMMARIZATION_REDUCE_FAN_IN: int = int(os.getenv("SUMMARIZATION_REDUCE_FAN_IN", "4"))
+    SUMMARIZATION_CACHE_DIR: str = os.getenv("SUMMARIZATION_CACHE_DIR", "cache/summaries")
+    SUMMARIZATION_CACHE_MAX_BYTES: int = int(os.getenv("SUMMARIZATION_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    SUMMARIZATION_EXTRACTIVE_FALLBACK: bool = os.getenv("SUMMARIZATION_EXTRACTIVE_FALLBACK", "true").lower() == "true"  # when the queue is full
+    
+    # Bulk action item extraction (nlp.pipe)
+    ACTION_EXTRACTION_PIPE_BATCH_SIZE: int = int(os.getenv("ACTION_EXTRACTION_PIPE_BATCH_SIZE", "32"))
+    ACTION_EXTRACTION_PIPE_PROCESSES: int = int(os.getenv("ACTION_EXTRACTION_PIPE_PROCESSES", "1"))
+    ACTION_EXTRACTION_BULK_WINDOW: int = int(os.getenv("ACTION_EXTRACTION_BULK_WINDOW", "256"))  # meetings read and written per round trip
+    
+    # Segment-mode action item extraction
+    ACTION_EXTRACTION_SEGMENT_BATCH: int = int(os.getenv("ACTION_EXTRACTION_SEGMENT_BATCH", "8"))  # most segments per batch
+    ACTION_EXTRACTION_CACHE_DIR: str = os.getenv("ACTION_EXTRACTION_CACHE_DIR", "cache/action_items")
+    ACTION_EXTRACTION_CACHE_MAX_BYTES: int = int(os.getenv("ACTION_EXTRACTION_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+    
+    # ML stage executors: worker threads per stage and how many more requests may wait
+    TRANSCRIPTION_WORKERS: int = int(os.getenv("TRANSCRIPTION_WORKERS", "1"))
+    TRANSCRIPTION_MAX_QUEUE: int = int(os.getenv("TRANSCRIPTION_MAX_QUEUE", "4"))
+    SUMMARIZATION_WORKERS: int = int(os.getenv("SUMMARIZATION_WORKERS", "1"))
+    SUMMARIZATION_MAX_QUEUE: int = int(os.getenv("SUMMARIZATION_MAX_QUEUE", "8"))
+    ACTION_EXTRACTION_WORKERS: int = int(os.getenv("ACTION_EXTRACTION_WORKERS", "2"))
+    ACTION_EXTRACTION_MAX_QUEUE: int = int(os.getenv("ACTION_EXTRACTION_MAX_QUEUE", "16"))
+    ML_RETRY_AFTER_SECONDS: int = int(os.getenv("ML_RETRY_AFTER_SECONDS", "30"))
+    
+    # Load and prime models in the background at startup instead of on first request
+    ML_WARMUP_ENABLED: bool = os.getenv("ML_WARMUP_ENABLED", "false").lower() == "true"
+    
     # Azure settings (for deployment)
     AZURE_STORAGE_CONNECTION_STRING: str = os.getenv("AZURE_STORAGE_CONNECTION_STRING", "")
     AZURE_CONTAINER_NAME: str = os.getenv("AZURE_CONTAINER_NAME", "meeting-recordings")
@@ -18,8 +18,17 @@ async def connect_to_mongo():
     logger.info("Connecting to MongoDB...")
     db.client = AsyncIOMotorClient(settings.MONGODB_URL)
     db.database = db.client[settings.DATABASE_NAME]
+    await create_indexes(db.database)
     logger.info("Connected to MongoDB")
 
+async def create_indexes(database):
+    """Create the indexes queries rely on; existing indexes are left as they are"""
+    # Near-duplicate lookups against a user's action items by LSH band
+    await database["action_items"].create_index([("user_id", 1), ("lsh_bands", 1)])
+    # Due date range filters, with and without a status
+    await database["action_items"].create_index([("user_id", 1), ("due_at", 1)])
+    await database["action_items"].create_index([("user_id", 1), ("status", 1), ("due_at", 1)])
+
 async def close_mongo_connection():
     """Close database connection"""
     logger.info("Closing MongoDB connection...")
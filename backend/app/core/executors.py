@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from fastapi import HTTPException, status
+from app.core.config import settings
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+class StageExecutor:
+    """
+    Dedicated, sized thread pool for one ML stage with a bounded admission queue
+    
+    At most max_workers calls run at once. Up to max_queue further requests may be
+    admitted and wait for a worker; beyond that the stage is saturated and new
+    requests are turned away with 429 instead of piling up behind the others.
+    """
+    
+    def __init__(self, name: str, max_workers: int, max_queue: int, retry_after: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"ml-{name}")
+        self.active = 0
+    
+    @property
+    def saturated(self) -> bool:
+        return self.active >= self.max_workers + self.max_queue
+    
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "saturated": self.saturated
+        }
+
+def reject_if_saturated(stage: StageExecutor):
+    """Reject the request with 429 when the stage has no free slot"""
+    if stage.saturated:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"The {stage.name} queue is full, please retry later",
+            headers={"Retry-After": str(stage.retry_after)},
+        )
+
+def admission(stage: StageExecutor, overflow: bool = False):
+    """
+    Route dependency that holds a slot on a stage for the duration of the request
+    
+    Yields True once admitted. When the stage is saturated the request is rejected
+    with 429, unless overflow is set, in which case it yields False without taking a
+    slot so the route can serve a cheaper fallback.
+    """
+    async def admit():
+        if stage.saturated and overflow:
+            yield False
+            return
+        reject_if_saturated(stage)
+        
+        stage.active += 1
+        try:
+            yield True
+        finally:
+            stage.active -= 1
+    
+    return admit
+
+@contextmanager
+def occupied(stage: StageExecutor):
+    """Count work started outside a request, such as the upload pipeline, against a stage"""
+    stage.active += 1
+    try:
+        yield
+    finally:
+        stage.active -= 1
+
+_torch_threads_configured = False
+
+def configure_torch_threads():
+    """Split the host's cores between the torch-backed stage workers, once per process"""
+    global _torch_threads_configured
+    if _torch_threads_configured:
+        return
+    _torch_threads_configured = True
+    
+    import torch
+    
+    torch_workers = transcription_executor.max_workers + summarization_executor.max_workers
+    threads = max(1, (os.cpu_count() or 1) // torch_workers)
+    torch.set_num_threads(threads)
+    logger.info(f"Using {threads} torch threads per worker across {torch_workers} workers")
+
+transcription_executor = StageExecutor(
+    "transcription",
+    max_workers=settings.TRANSCRIPTION_WORKERS,
+    max_queue=settings.TRANSCRIPTION_MAX_QUEUE,
+    retry_after=settings.ML_RETRY_AFTER_SECONDS
+)
+
+summarization_executor = StageExecutor(
+    "summarization",
+    max_workers=settings.SUMMARIZATION_WORKERS,
+    max_queue=settings.SUMMARIZATION_MAX_QUEUE,
+    retry_after=settings.ML_RETRY_AFTER_SECONDS
+)
+
+action_extraction_executor = StageExecutor(
+    "action_extraction",
+    max_workers=settings.ACTION_EXTRACTION_WORKERS,
+    max_queue=settings.ACTION_EXTRACTION_MAX_QUEUE,
+    retry_after=settings.ML_RETRY_AFTER_SECONDS
+)
@@ -1,19 +1,41 @@
+import time
+
+# Measured from the first import so startup cost includes loading every router
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+import asyncio
+import logging
 import os
 
 from app.core.config import settings
 from app.core.database import connect_to_mongo, close_mongo_connection
+from app.core.executors import transcription_executor, summarization_executor, action_extraction_executor
 from app.api.routes import auth, meetings, transcription, summarization, tasks, calendar_integration
+from app.ml.warmup import warmup_models, model_states, models_ready
+
+logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await connect_to_mongo()
+    
+    # Models load in the background so /health is served immediately
+    app.state.warmup_task = None
+    if settings.ML_WARMUP_ENABLED:
+        app.state.warmup_task = asyncio.create_task(warmup_models())
+    
+    app.state.startup_seconds = time.perf_counter() - _import_started
+    logger.info(f"Startup completed in {app.state.startup_seconds:.2f}s")
     yield
     # Shutdown
+    if app.state.warmup_task is not None and not app.state.warmup_task.done():
+        app.state.warmup_task.cancel()
     await close_mongo_connection()
 
 # Create FastAPI app
@@ -59,6 +81,23 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/ready")
+async def readiness_check():
+    """Report per-model load state; not ready until warmup has loaded the default models"""
+    ready = models_ready() or not settings.ML_WARMUP_ENABLED
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "ready": ready,
+            "startup_seconds": getattr(app.state, "startup_seconds", None),
+            "models": model_states(),
+            "executors": {
+                executor.name: executor.stats()
+                for executor in (transcription_executor, summarization_executor, action_extraction_executor)
+            }
+        }
+    )
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -1,18 +1,54 @@
-import spacy
-import re
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 import asyncio
+import bisect
 import logging
+import re
 from datetime import datetime, timedelta
+from app.core.config import settings
+from app.core.executors import action_extraction_executor
+from app.ml.cache import ResultCache, make_key
+from app.ml.dedup import MinHashIndex, minhash, same_assignees
+from app.ml.matchers import SentenceMatcher, SentenceMatch
 
 logger = logging.getLogger(__name__)
 
+# Pipeline components whose output extraction never reads; only sentences and entities are used
+UNUSED_COMPONENTS = ["tagger", "attribute_ruler", "lemmatizer", "textcat"]
+
+# A segment whose text ends a sentence, optionally followed by closing quotes or brackets
+_SENTENCE_END = re.compile(r"[.!?][\"')\]]*\s*$")
+
+def group_segments(segments: List[Dict], max_segments: int = 8) -> List[List[Dict]]:
+    """
+    Split transcript segments into runs of consecutive segments that end a sentence
+    
+    Boundaries only depend on the segments since the previous boundary, so editing one
+    segment changes the run it belongs to and leaves the others as they were.
+    """
+    batches = []
+    batch = []
+    for segment in segments:
+        batch.append(segment)
+        if len(batch) >= max_segments or _SENTENCE_END.search(segment["text"]):
+            batches.append(batch)
+            batch = []
+    if batch:
+        batches.append(batch)
+    return batches
+
 class ActionItemExtractor:
     """Extract action items and tasks from meeting transcripts using spaCy"""
     
-    def __init__(self, model_name: str = "en_core_web_sm"):
+    MODES = ["transcript", "segments"]
+    
+    def __init__(self, model_name: str = "en_core_web_sm", cache: Optional[ResultCache] = None,
+                 segment_batch_size: int = 8):
         self.model_name = model_name
+        self.cache = cache
+        self.segment_batch_size = segment_batch_size
         self.nlp = None
+        self.state = "not_loaded"  # not_loaded, loading, ready, failed
+        self._load_lock = asyncio.Lock()
         
         # Action keywords and patterns
         self.action_keywords = [
@@ -28,17 +64,40 @@ class ActionItemExtractor:
             r"\b(?:next week|this week|end of week|eow)\b"
         ]
         
+        # Keywords, imperative words and date patterns compiled into a single scan
+        self.matcher = SentenceMatcher(
+            self.action_keywords, self.date_patterns, ["must", "will", "should", "need"]
+        )
+        
     async def load_model(self):
         """Load spaCy model asynchronously"""
-        if self.nlp is None:
-            logger.info(f"Loading spaCy model: {self.model_name}")
-            
-            loop = asyncio.get_event_loop()
-            self.nlp = await loop.run_in_executor(
-                None, spacy.load, self.model_name
-            )
-            
-            logger.info("spaCy model loaded successfully")
+        async with self._load_lock:
+            if self.nlp is None:
+                logger.info(f"Loading spaCy model: {self.model_name}")
+                self.state = "loading"
+                
+                # Imported here so that importing this module stays cheap
+                import spacy
+                
+                loop = asyncio.get_event_loop()
+                try:
+                    self.nlp = await loop.run_in_executor(
+                        action_extraction_executor.pool, spacy.load, self.model_name
+                    )
+                except Exception:
+                    self.state = "failed"
+                    raise
+                
+                self.state = "ready"
+                logger.info("spaCy model loaded successfully")
+    
+    async def warmup(self):
+        """Load the pipeline and parse one sentence so the first request is not cold"""
+        await self.load_model()
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            action_extraction_executor.pool, self.nlp, "John will send the report by Friday."
+        )
     
     async def extract_action_items(self, transcript: str) -> List[Dict]:
         """
@@ -56,53 +115,191 @@ class ActionItemExtractor:
             
             logger.info("Starting action item extraction")
             
-            # Process text with spaCy
+            # Parsing, scoring and ranking all happen in a single executor call
             loop = asyncio.get_event_loop()
-            doc = await loop.run_in_executor(
-                None, self.nlp, transcript
+            ranked_actions = await loop.run_in_executor(
+                action_extraction_executor.pool, self._extract_sync, transcript
             )
             
-            action_items = []
-            sentences = [sent.text.strip() for sent in doc.sents]
+            logger.info(f"Extracted {len(ranked_actions)} action items")
+            return ranked_actions
             
-            for sentence in sentences:
-                if self._contains_action_keywords(sentence):
-                    action_item = await self._process_action_sentence(sentence)
-                    if action_item:
-                        action_items.append(action_item)
+        except Exception as e:
+            logger.error(f"Action item extraction failed: {str(e)}")
+            raise Exception(f"Action item extraction failed: {str(e)}")
+    
+    async def extract_action_items_from_segments(self, segments: List[Dict]) -> List[Dict]:
+        """
+        Extract action items from timestamped transcript segments
+        
+        Segments are extracted in sentence-aligned runs whose results are cached by
+        content, so re-extracting an edited transcript only parses the changed runs.
+        
+        Args:
+            segments: Transcript segments with start, end and text
+        
+        Returns:
+            List[Dict]: Extracted action items, each with the start and end in seconds
+            of the segments it was said in
+        """
+        try:
+            if self.nlp is None:
+                await self.load_model()
             
-            # Remove duplicates and rank by confidence
-            unique_actions = self._deduplicate_actions(action_items)
-            ranked_actions = sorted(unique_actions, key=lambda x: x['confidence'], reverse=True)
+            logger.info(f"Starting action item extraction from {len(segments)} segments")
             
-            logger.info(f"Extracted {len(ranked_actions)} action items")
-            return ranked_actions
+            loop = asyncio.get_event_loop()
+            ranked_actions, cached_batches, batches = await loop.run_in_executor(
+                action_extraction_executor.pool, self._extract_segments_sync, segments
+            )
             
+            logger.info(
+                f"Extracted {len(ranked_actions)} action items "
+                f"({cached_batches}/{batches} segment batches cached)"
+            )
+            return ranked_actions
+        
         except Exception as e:
             logger.error(f"Action item extraction failed: {str(e)}")
             raise Exception(f"Action item extraction failed: {str(e)}")
     
+    async def extract_action_items_bulk(self, transcripts: List[str], batch_size: int = 32,
+                                        n_process: int = 1) -> List[List[Dict]]:
+        """
+        Extract action items from many transcripts with a single nlp.pipe run
+        
+        Args:
+            transcripts: Meeting transcript texts
+            batch_size: Transcripts per spaCy batch
+            n_process: spaCy worker processes; 1 parses in the executor thread
+        
+        Returns:
+            List[List[Dict]]: Ranked action items for each transcript, in input order
+        """
+        if self.nlp is None:
+            await self.load_model()
+        
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            action_extraction_executor.pool,
+            lambda: list(self._extract_many_sync(transcripts, batch_size, n_process))
+        )
+    
+    def _disabled_components(self) -> List[str]:
+        return [name for name in self.nlp.pipe_names if name in UNUSED_COMPONENTS]
+    
+    def _extract_sync(self, transcript: str) -> List[Dict]:
+        """Parse the transcript once and build action items from its sentence spans"""
+        return self._extract_from_doc(self.nlp(transcript, disable=self._disabled_components()))
+    
+    def _extract_many_sync(self, transcripts: Iterable[str], batch_size: int = 32,
+                           n_process: int = 1) -> Iterator[List[Dict]]:
+        """Stream transcripts through nlp.pipe, yielding ranked action items per transcript"""
+        docs = self.nlp.pipe(
+            transcripts,
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=self._disabled_components()
+        )
+        for doc in docs:
+            yield self._extract_from_doc(doc)
+    
+    def _extract_segments_sync(self, segments: List[Dict]) -> Tuple[List[Dict], int, int]:
+        """Extract action items per segment batch, parsing only batches missing from the cache"""
+        batches = group_segments(segments, self.segment_batch_size)
+        results = [None] * len(batches)
+        keys = [self._segment_batch_key(batch) for batch in batches]
+        
+        if self.cache is not None:
+            for index, key in enumerate(keys):
+                cached = self.cache.get(key)
+                if cached is not None:
+                    results[index] = cached["action_items"]
+        
+        misses = [index for index, result in enumerate(results) if result is None]
+        docs = self.nlp.pipe(
+            ("".join(segment["text"] for segment in batches[index]) for index in misses),
+            disable=self._disabled_components()
+        )
+        for index, doc in zip(misses, docs):
+            results[index] = self._segment_actions(doc, batches[index])
+            if self.cache is not None:
+                self.cache.set(keys[index], {"action_items": results[index]})
+        
+        extracted_at = datetime.utcnow().isoformat()
+        action_items = [
+            {**action_item, "extracted_at": extracted_at}
+            for result in results
+            for action_item in result
+        ]
+        return self._rank_actions(action_items), len(batches) - len(misses), len(batches)
+    
+    def _segment_batch_key(self, batch: List[Dict]) -> str:
+        return make_key(
+            "action_items",
+            self.model_name,
+            self.action_keywords,
+            self.date_patterns,
+            [(segment["text"], segment["start"], segment["end"]) for segment in batch]
+        )
+    
+    def _segment_actions(self, doc, batch: List[Dict]) -> List[Dict]:
+        """Action items of one parsed segment batch, timed by the segments each sentence spans"""
+        # Character offset at which each segment starts in the batch text
+        offsets = []
+        position = 0
+        for segment in batch:
+            offsets.append(position)
+            position += len(segment["text"])
+        
+        action_items = []
+        for sent, action_item in self._action_sentences(doc):
+            first = bisect.bisect_right(offsets, sent.start_char) - 1
+            last = bisect.bisect_right(offsets, max(sent.end_char - 1, sent.start_char)) - 1
+            action_item.pop("extracted_at")
+            action_item["start"] = batch[first]["start"]
+            action_item["end"] = batch[last]["end"]
+            action_items.append(action_item)
+        return action_items
+    
+    def _extract_from_doc(self, doc) -> List[Dict]:
+        """Build ranked action items from the sentence spans of a parsed transcript"""
+        return self._rank_actions([action_item for _, action_item in self._action_sentences(doc)])
+    
+    def _action_sentences(self, doc):
+        """Yield each sentence span of doc that reads as an action item, with the item"""
+        for sent in doc.sents:
+            sentence = sent.text.strip()
+            match = self.matcher.scan(sentence)
+            if match.keywords:
+                action_item = self._process_action_sentence(sent, sentence, match)
+                if action_item:
+                    yield sent, action_item
+    
+    def _rank_actions(self, action_items: List[Dict]) -> List[Dict]:
+        # Remove duplicates and rank by confidence
+        unique_actions = self._deduplicate_actions(action_items)
+        return sorted(unique_actions, key=lambda x: x['confidence'], reverse=True)
+    
     def _contains_action_keywords(self, sentence: str) -> bool:
         """Check if sentence contains action keywords"""
-        sentence_lower = sentence.lower()
-        return any(keyword in sentence_lower for keyword in self.action_keywords)
+        return bool(self.matcher.scan(sentence).keywords)
     
-    async def _process_action_sentence(self, sentence: str) -> Dict:
-        """Process individual action sentence"""
-        loop = asyncio.get_event_loop()
-        doc = await loop.run_in_executor(None, self.nlp, sentence)
+    def _process_action_sentence(self, sent, sentence: str, match: Optional[SentenceMatch] = None) -> Dict:
+        """Process individual action sentence, reusing the entities of the parsed document"""
+        if match is None:
+            match = self.matcher.scan(sentence)
         
         # Extract entities
-        persons = [ent.text for ent in doc.ents if ent.label_ == "PERSON"]
-        dates = [ent.text for ent in doc.ents if ent.label_ in ["DATE", "TIME"]]
-        orgs = [ent.text for ent in doc.ents if ent.label_ == "ORG"]
+        persons = [ent.text for ent in sent.ents if ent.label_ == "PERSON"]
+        dates = [ent.text for ent in sent.ents if ent.label_ in ["DATE", "TIME"]]
+        orgs = [ent.text for ent in sent.ents if ent.label_ == "ORG"]
         
-        # Extract dates using patterns
-        extracted_dates = self._extract_dates(sentence)
-        dates.extend(extracted_dates)
+        # Dates found by the patterns
+        dates.extend(match.dates)
         
         # Calculate confidence score
-        confidence = self._calculate_confidence(sentence, persons, dates)
+        confidence = self._calculate_confidence(sentence, persons, dates, match)
         
         if confidence > 0.3:  # Threshold for valid action items
             return {
@@ -119,21 +316,17 @@ class ActionItemExtractor:
     
     def _extract_dates(self, text: str) -> List[str]:
         """Extract dates using regex patterns"""
-        dates = []
-        for pattern in self.date_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                dates.append(match.group())
-        return dates
-    
-    def _calculate_confidence(self, sentence: str, persons: List[str], dates: List[str]) -> float:
+        return self.matcher.scan(text).dates
+    
+    def _calculate_confidence(self, sentence: str, persons: List[str], dates: List[str],
+                              match: Optional[SentenceMatch] = None) -> float:
         """Calculate confidence score for action item"""
         score = 0.0
-        sentence_lower = sentence.lower()
+        if match is None:
+            match = self.matcher.scan(sentence)
         
         # Base score for containing action keywords
-        action_keyword_count = sum(1 for keyword in self.action_keywords if keyword in sentence_lower)
-        score += min(action_keyword_count * 0.2, 0.6)
+        score += min(len(match.keywords) * 0.2, 0.6)
         
         # Boost for having assignees
         if persons:
@@ -144,7 +337,7 @@ class ActionItemExtractor:
             score += 0.2
         
         # Boost for imperative verbs
-        if any(word in sentence_lower for word in ["must", "will", "should", "need"]):
+        if match.imperative:
             score += 0.1
         
         # Penalty for questions
@@ -154,18 +347,38 @@ class ActionItemExtractor:
         return min(score, 1.0)
     
     def _deduplicate_actions(self, actions: List[Dict]) -> List[Dict]:
-        """Remove duplicate action items"""
+        """
+        Merge action items that restate the same task
+        
+        Near-duplicates are found with a MinHash index over the content words of each
+        item. The most confident restatement is kept and takes the assignees,
+        organizations and due date of the ones merged into it. Items for different
+        people are never merged.
+        """
         unique_actions = []
-        seen_texts = set()
+        index = MinHashIndex()
         
-        for action in actions:
-            # Simple deduplication based on text similarity
-            text_key = action["text"].lower().strip()
-            if text_key not in seen_texts:
-                seen_texts.add(text_key)
+        for action in sorted(actions, key=lambda x: x['confidence'], reverse=True):
+            signature = minhash(action["text"])
+            for position, _ in index.query(signature):
+                kept = unique_actions[position]
+                if same_assignees(kept["assignees"], action["assignees"]):
+                    self._merge_action(kept, action)
+                    break
+            else:
+                index.add(len(unique_actions), signature)
                 unique_actions.append(action)
         
         return unique_actions
+    
+    def _merge_action(self, kept: Dict, duplicate: Dict):
+        for field in ("assignees", "organizations"):
+            kept[field] = kept[field] + [value for value in duplicate[field] if value not in kept[field]]
+        if kept["due_date"] is None:
+            kept["due_date"] = duplicate["due_date"]
 
 # Global action item extractor instance
-action_extractor = ActionItemExtractor()
\ No newline at end of file
+action_extractor = ActionItemExtractor(
+    cache=ResultCache(settings.ACTION_EXTRACTION_CACHE_DIR, settings.ACTION_EXTRACTION_CACHE_MAX_BYTES),
+    segment_batch_size=settings.ACTION_EXTRACTION_SEGMENT_BATCH
+)
\ No newline at end of file
@@ -0,0 +1,95 @@
+import numpy as np
+import logging
+import os
+import subprocess
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Whisper's input sample rate
+SAMPLE_RATE = 16000
+
+def decoded_path(audio_path: str) -> str:
+    """Location of the canonical 16 kHz mono float32 copy of an audio file"""
+    return f"{audio_path}.16k.npy"
+
+def _is_decoded(audio_path: str) -> bool:
+    npy_path = decoded_path(audio_path)
+    return os.path.exists(npy_path) and os.path.getmtime(npy_path) >= os.path.getmtime(audio_path)
+
+def decode_to_npy(audio_path: str) -> str:
+    """
+    Decode an audio file once with ffmpeg and store it next to the original
+    
+    The decoded copy is reused while it is newer than the source file.
+    
+    Args:
+        audio_path: Path to the uploaded audio file
+    
+    Returns:
+        str: Path to the .npy file
+    """
+    npy_path = decoded_path(audio_path)
+    if _is_decoded(audio_path):
+        return npy_path
+    
+    import whisper
+    
+    logger.info(f"Decoding audio to {npy_path}")
+    audio = whisper.load_audio(audio_path)
+    
+    # Write to a temporary file first so concurrent readers never see a partial array
+    fd, tmp_path = tempfile.mkstemp(suffix=".npy", dir=os.path.dirname(npy_path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, audio)
+        os.replace(tmp_path, npy_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    
+    return npy_path
+
+def load_decoded(audio_path: str) -> np.ndarray:
+    """Memory-map the decoded samples of an audio file, decoding it first if needed"""
+    return np.load(decode_to_npy(audio_path), mmap_mode="r")
+
+def probe_duration(audio_path: str) -> float:
+    """Duration of an audio file in seconds from its container metadata, without decoding it"""
+    output = subprocess.run(
+        [
+            "ffprobe", "-v", "error", "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1", audio_path
+        ],
+        capture_output=True, check=True, text=True
+    ).stdout
+    return float(output.strip())
+
+def audio_duration(audio_path: str) -> float:
+    """
+    Duration of an audio file in seconds
+    
+    Read from the decoded copy when there is one, else probed from the container so
+    routing a cached file does not pay for a full decode. Files ffprobe cannot read
+    are decoded.
+    """
+    if not _is_decoded(audio_path):
+        try:
+            return probe_duration(audio_path)
+        except (OSError, subprocess.CalledProcessError, ValueError) as e:
+            logger.warning(f"Could not probe the duration of {audio_path}: {str(e)}")
+    return len(load_decoded(audio_path)) / SAMPLE_RATE
+
+def prepare_audio(audio_path: str):
+    """Decode an upload ahead of transcription; failures are left for the transcriber to report"""
+    try:
+        decode_to_npy(audio_path)
+    except Exception as e:
+        logger.warning(f"Could not pre-decode {audio_path}: {str(e)}")
+
+def remove_decoded(audio_path: str):
+    """Delete the decoded copy of an audio file if it exists"""
+    npy_path = decoded_path(audio_path)
+    if os.path.exists(npy_path):
+        os.remove(npy_path)
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class MicroBatcher:
+    """
+    Collect work items from concurrent callers and process them in batches
+
+    The first queued item opens a batch; the batch is closed when it reaches
+    max_batch_size or max_wait_ms has passed, whichever comes first. Items are
+    grouped by key so that only compatible items (same decoding options) share a call.
+    Batches are processed one at a time, so the model is never driven from two threads.
+    """
+
+    def __init__(self, process_batch: Callable[[List[Any], Hashable], List[Any]],
+                 max_batch_size: int = 8, max_wait_ms: float = 50.0, executor=None):
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.executor = executor
+        self._queue = None
+        self._worker = None
+        self._in_flight = 0
+
+    @property
+    def depth(self) -> int:
+        """Items queued or being processed"""
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return queued + self._in_flight
+
+    async def submit(self, item: Any, key: Optional[Hashable] = None) -> Any:
+        """Queue an item and wait for its result"""
+        loop = asyncio.get_event_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+        future = loop.create_future()
+        await self._queue.put((key, item, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            groups = OrderedDict()
+            for key, item, future in batch:
+                groups.setdefault(key, []).append((item, future))
+
+            self._in_flight = len(batch)
+            for key, entries in groups.items():
+                items = [item for item, _ in entries]
+                try:
+                    results = await loop.run_in_executor(self.executor, self.process_batch, items, key)
+                except Exception as e:
+                    logger.error(f"Batch of {len(items)} items failed: {str(e)}")
+                    for _, future in entries:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, future), result in zip(entries, results):
+                    if not future.done():
+                        future.set_result(result)
+            self._in_flight = 0
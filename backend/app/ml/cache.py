@@ -0,0 +1,116 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+def hash_file(path: str, block_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def make_key(*parts: Any) -> str:
+    """Build a stable cache key from JSON-serializable parts"""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResultCache:
+    """Size-bounded LRU cache of JSON results stored as files on local disk"""
+    
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = None  # key -> size in bytes, least recently used first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached value for key, or None on a miss"""
+        with self._lock:
+            self._load_index()
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    value = json.load(f)
+                # Touch the file so recency survives a restart
+                os.utime(path)
+            except (OSError, ValueError):
+                self._drop(key)
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: str, value: Dict):
+        """Store value under key and evict least recently used entries over the size limit"""
+        data = json.dumps(value).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        
+        with self._lock:
+            self._load_index()
+            path = self._path(key)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            
+            while self._total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+    
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            self._load_index()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes
+            }
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+    
+    def _load_index(self):
+        """Build the LRU index from files already on disk, oldest access first"""
+        if self._entries is not None:
+            return
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        files = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        self._entries = OrderedDict((p.stem, p.stat().st_size) for p in files)
+        self._total_bytes = sum(self._entries.values())
+        logger.info(f"Loaded {len(self._entries)} cache entries from {self.cache_dir}")
+    
+    def _drop(self, key: str):
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
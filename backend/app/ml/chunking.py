@@ -0,0 +1,117 @@
+import re
+import zlib
+import numpy as np
+from typing import List, Tuple
+
+# End of a sentence: terminal punctuation, optional closing quotes/brackets, then whitespace
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s+")
+_WORD = re.compile(r"\S+")
+
+def token_offsets(text: str, tokenizer=None) -> np.ndarray:
+    """
+    Character offsets of each token in text
+    
+    Uses the offset mapping of a fast Hugging Face tokenizer; without one,
+    whitespace-separated words stand in for tokens.
+    
+    Returns:
+        np.ndarray: (n_tokens, 2) array of (start, end) character offsets
+    """
+    if tokenizer is not None and getattr(tokenizer, "is_fast", False):
+        encoding = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True, verbose=False)
+        offsets = encoding["offset_mapping"]
+    else:
+        offsets = [match.span() for match in _WORD.finditer(text)]
+    return np.array(offsets, dtype=np.int64).reshape(-1, 2)
+
+def sentence_starts(text: str) -> np.ndarray:
+    """Character offsets at which sentences begin"""
+    return np.array([0] + [match.end() for match in _SENTENCE_END.finditer(text)], dtype=np.int64)
+
+def is_cut(text: str, tokens: int, target_tokens: float) -> bool:
+    """
+    Whether a piece of text should end its chunk
+    
+    Decided by a hash of the text alone, with a chance proportional to its token
+    count, so cuts come about every target_tokens tokens and do not move when text
+    elsewhere changes.
+    """
+    return zlib.crc32(text.encode("utf-8")) < min(1.0, tokens / max(1.0, target_tokens)) * 0xFFFFFFFF
+
+def chunk_spans(text: str, tokenizer=None, max_tokens: int = 1024, overlap_tokens: int = 0) -> List[Tuple[int, int]]:
+    """
+    Split text into chunks of at most max_tokens model tokens
+    
+    Once a chunk holds half the budget, it ends at the next sentence is_cut picks
+    from the sentence's own text, so an edit that changes the length of a sentence
+    only moves the boundaries around it rather than every later one. A chunk that
+    reaches the budget first ends there; a single sentence longer than the budget
+    is cut at token boundaries.
+    Each chunk after the first starts with up to overlap_tokens worth of whole
+    sentences from the end of the previous one. The text is tokenized once, so
+    this runs in linear time.
+    
+    Args:
+        text: Text to split
+        tokenizer: Tokenizer of the model the chunks are fed to
+        max_tokens: Token budget per chunk, including the model's special tokens
+        overlap_tokens: Tokens of context repeated between consecutive chunks
+    
+    Returns:
+        List[Tuple[int, int]]: (start, end) character spans of the chunks
+    """
+    offsets = token_offsets(text, tokenizer)
+    if len(offsets) == 0:
+        return []
+    
+    if tokenizer is not None:
+        max_tokens -= tokenizer.num_special_tokens_to_add()
+    max_tokens = max(1, max_tokens)
+    overlap_tokens = max(0, min(overlap_tokens, max_tokens // 2))
+    
+    # Token index at which each sentence starts
+    sentence_of_token = np.searchsorted(sentence_starts(text), offsets[:, 0], side="right") - 1
+    sentence_bounds = np.concatenate([[0], np.flatnonzero(np.diff(sentence_of_token)) + 1, [len(offsets)]])
+    
+    # Packing units: sentences, with over-long ones cut to fit the budget
+    units = [0]
+    for start, end in zip(sentence_bounds[:-1], sentence_bounds[1:]):
+        units.extend(range(int(start) + max_tokens, int(end), max_tokens))
+        units.append(int(end))
+    
+    n_units = len(units) - 1
+    min_tokens = max_tokens // 2
+    target_tokens = max_tokens / 4
+    cuts = [
+        is_cut(
+            text[offsets[units[unit], 0]:offsets[units[unit + 1] - 1, 1]],
+            units[unit + 1] - units[unit],
+            target_tokens
+        )
+        for unit in range(n_units)
+    ]
+    
+    spans = []
+    first = 0
+    fresh = 0  # first unit not covered by an earlier chunk; overlap units never end a chunk
+    while first < n_units:
+        last = first + 1
+        while (last < n_units
+               and not (cuts[last - 1] and last - 1 >= fresh and units[last] - units[first] >= min_tokens)
+               and units[last + 1] - units[first] <= max_tokens):
+            last += 1
+        spans.append((int(offsets[units[first], 0]), int(offsets[units[last] - 1, 1])))
+        if last >= n_units:
+            break
+        
+        # Step back over whole units to repeat them at the start of the next chunk,
+        # as long as the next unit still fits alongside them
+        next_first = last
+        while (next_first - 1 > first
+               and units[last] - units[next_first - 1] <= overlap_tokens
+               and units[last + 1] - units[next_first - 1] <= max_tokens):
+            next_first -= 1
+        first = next_first
+        fresh = last
+    
+    return spans
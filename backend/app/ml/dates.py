@@ -0,0 +1,110 @@
+import calendar
+import re
+from datetime import datetime, time, timedelta
+from typing import Optional
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+MONTHS = [
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december"
+]
+
+_NUMBERS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10
+}
+
+# Words around a date that do not change when it is
+_LEADING = re.compile(r"^(?:(?:by|before|until|till|due|on|the|at|end of)\s+)+")
+_NUMERIC = re.compile(r"^(\d{1,2})[/\-](\d{1,2})(?:[/\-](\d{2,4}))?$")
+_MONTH_DAY = re.compile(r"^([a-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?$")
+_DAY_MONTH = re.compile(r"^(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?([a-z]+)(?:,?\s+(\d{4}))?$")
+_IN_PERIOD = re.compile(r"^(?:in\s+|within\s+)?(\d+|[a-z]+)\s+(day|week|month)s?(?:\s+from now)?$")
+
+def _month(name: str) -> Optional[int]:
+    for index, month in enumerate(MONTHS, start=1):
+        if len(name) >= 3 and month.startswith(name):
+            return index
+    return None
+
+def _end_of_day(day) -> datetime:
+    return datetime.combine(day, time(23, 59, 59))
+
+def _upcoming(reference: datetime, month: int, day: int, year: Optional[int]) -> Optional[datetime]:
+    """The given month and day, in the given year or else the first one not before reference"""
+    try:
+        if year is not None:
+            return _end_of_day(datetime(year, month, day))
+        candidate = datetime(reference.year, month, day)
+        if candidate.date() < reference.date():
+            candidate = datetime(reference.year + 1, month, day)
+        return _end_of_day(candidate)
+    except ValueError:
+        return None
+
+def _year(value: Optional[str]) -> Optional[int]:
+    if value is None:
+        return None
+    year = int(value)
+    return year + 2000 if year < 100 else year
+
+def resolve_due_date(text: str, reference: datetime) -> Optional[datetime]:
+    """
+    Resolve a due date phrase such as "by friday", "next week" or "12/05" to a datetime
+    
+    Relative phrases are taken relative to reference, normally when the meeting took
+    place. Days resolve to their end (23:59:59); weeks to their Friday. Numeric dates
+    are read month first. Returns None for phrases that do not name a day.
+    """
+    phrase = " ".join(text.lower().replace(",", " ").split())
+    phrase = _LEADING.sub("", phrase)
+    today = reference.date()
+    
+    if phrase in ("today", "tonight", "day", "eod"):
+        return _end_of_day(today)
+    if phrase == "tomorrow":
+        return _end_of_day(today + timedelta(days=1))
+    
+    # Weekdays: the next one after today, or the one in the following week after "next"
+    words = phrase.split()
+    if words and words[-1] in WEEKDAYS and len(words) <= 2:
+        weekday = WEEKDAYS.index(words[-1])
+        if words[0] == "next" and len(words) == 2:
+            monday = today - timedelta(days=today.weekday()) + timedelta(weeks=1)
+            return _end_of_day(monday + timedelta(days=weekday))
+        if len(words) == 1 or words[0] == "this":
+            days_ahead = (weekday - today.weekday()) % 7 or 7
+            return _end_of_day(today + timedelta(days=days_ahead))
+    
+    if phrase in ("this week", "week", "eow"):
+        friday = today + timedelta(days=4 - today.weekday())
+        return _end_of_day(max(friday, today))
+    if phrase == "next week":
+        return _end_of_day(today - timedelta(days=today.weekday()) + timedelta(days=11))
+    if phrase in ("this month", "month", "eom"):
+        last_day = calendar.monthrange(today.year, today.month)[1]
+        return _end_of_day(today.replace(day=last_day))
+    if phrase == "next month":
+        year, month = (today.year + 1, 1) if today.month == 12 else (today.year, today.month + 1)
+        return _end_of_day(datetime(year, month, calendar.monthrange(year, month)[1]))
+    
+    match = _NUMERIC.match(phrase)
+    if match:
+        return _upcoming(reference, int(match.group(1)), int(match.group(2)), _year(match.group(3)))
+    
+    match = _MONTH_DAY.match(phrase)
+    if match and _month(match.group(1)):
+        return _upcoming(reference, _month(match.group(1)), int(match.group(2)), _year(match.group(3)))
+    
+    match = _DAY_MONTH.match(phrase)
+    if match and _month(match.group(2)):
+        return _upcoming(reference, _month(match.group(2)), int(match.group(1)), _year(match.group(3)))
+    
+    match = _IN_PERIOD.match(phrase)
+    if match:
+        count = int(match.group(1)) if match.group(1).isdigit() else _NUMBERS.get(match.group(1))
+        if count is not None:
+            days = {"day": 1, "week": 7, "month": 30}[match.group(2)] * count
+            return _end_of_day(today + timedelta(days=days))
+    
+    return None
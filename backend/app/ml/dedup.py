@@ -0,0 +1,95 @@
+import re
+import zlib
+from collections import defaultdict
+import numpy as np
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+from app.ml.extractive import STOP_WORDS
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Phrasing that marks a sentence as an action item without saying what the action is
+FILLER_WORDS = frozenset("""
+action item items todo task tasks need needs needed must going gonna let's lets someone somebody
+deadline due follow followup make sure please
+""".split())
+
+SHINGLE_SIZE = 4
+NUM_PERM = 60
+BANDS = 20  # of NUM_PERM // BANDS rows each; pairs from about 0.3 Jaccard up become likely candidates
+DUPLICATE_THRESHOLD = 0.7
+
+_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(20231117)
+_A = _rng.randint(1, _PRIME, NUM_PERM).astype(np.uint64)
+_B = _rng.randint(0, _PRIME, NUM_PERM).astype(np.uint64)
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Character shingles of the content words of text"""
+    words = _WORD.findall(text.lower())
+    content = " ".join(word for word in words if word not in STOP_WORDS and word not in FILLER_WORDS)
+    if not content:
+        content = " ".join(words)
+    if len(content) <= size:
+        return {content}
+    return {content[i:i + size] for i in range(len(content) - size + 1)}
+
+def minhash(text: str) -> List[int]:
+    """MinHash signature of the shingles of text"""
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) & _PRIME for shingle in shingles(text)),
+        dtype=np.uint64
+    )
+    # (a * x + b) mod p for every permutation and shingle; products stay below 2^62
+    values = (_A[:, None] * hashes[None, :] + _B[:, None]) % _PRIME
+    return values.min(axis=1).tolist()
+
+def similarity(signature: List[int], other: List[int]) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures"""
+    return float(np.mean(np.asarray(signature) == np.asarray(other)))
+
+def band_keys(signature: List[int]) -> List[str]:
+    """LSH bucket keys; texts that share a key are candidate near-duplicates"""
+    rows = NUM_PERM // BANDS
+    values = np.asarray(signature, dtype=np.uint64)
+    return [
+        f"{band}:{zlib.crc32(values[band * rows:(band + 1) * rows].tobytes()):08x}"
+        for band in range(BANDS)
+    ]
+
+class MinHashIndex:
+    """
+    In-memory LSH index over MinHash signatures
+    
+    Lookups only compare against entries that share a band bucket, instead of
+    every entry in the index.
+    """
+    
+    def __init__(self, threshold: float = DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        self.buckets: Dict[str, List[Hashable]] = defaultdict(list)
+        self.signatures: Dict[Hashable, List[int]] = {}
+    
+    def add(self, key: Hashable, signature: List[int], bands: Optional[List[str]] = None):
+        self.signatures[key] = signature
+        for band in bands or band_keys(signature):
+            self.buckets[band].append(key)
+    
+    def query(self, signature: List[int], bands: Optional[List[str]] = None) -> List[Tuple[Hashable, float]]:
+        """Entries at least threshold similar to signature, most similar first"""
+        candidates = set()
+        for band in bands or band_keys(signature):
+            candidates.update(self.buckets.get(band, ()))
+        
+        matches = []
+        for key in candidates:
+            score = similarity(signature, self.signatures[key])
+            if score >= self.threshold:
+                matches.append((key, score))
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+def same_assignees(assignees: List[str], other: List[str]) -> bool:
+    """Whether two items can be the same task; unassigned items match anyone"""
+    if not assignees or not other:
+        return True
+    return bool(set(assignees) & set(other))
@@ -0,0 +1,132 @@
+import re
+import numpy as np
+from typing import List, Dict
+from app.ml.chunking import sentence_starts
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+# Common function words that carry no topical weight
+STOP_WORDS = frozenset("""
+a about above after again all also am an and any are as at be because been before being below between
+both but by can could did do does doing down during each few for from further had has have having he her
+here hers him his how i if in into is it its itself just like me more most my no nor not now of off on
+once only or other our ours out over own really same she should so some such than that the their theirs
+them then there these they this those through to too um uh under until up very was we were what when
+where which while who whom why will with would yeah you your yours okay ok
+""".split())
+
+def split_sentences(text: str) -> List[str]:
+    """Split text on sentence-ending punctuation"""
+    bounds = list(sentence_starts(text)) + [len(text)]
+    sentences = [text[start:end].strip() for start, end in zip(bounds[:-1], bounds[1:])]
+    return [sentence for sentence in sentences if sentence]
+
+def tfidf_matrix(sentences: List[str], max_features: int = 2048) -> np.ndarray:
+    """
+    L2-normalized TF-IDF vectors of the sentences
+    
+    The vocabulary is limited to the max_features terms that occur in the most sentences.
+    
+    Returns:
+        np.ndarray: (n_sentences, n_terms) float32 matrix
+    """
+    tokenized = [
+        [word for word in _WORD.findall(sentence.lower()) if word not in STOP_WORDS]
+        for sentence in sentences
+    ]
+    vocabulary = {}
+    rows, columns = [], []
+    for row, words in enumerate(tokenized):
+        for word in words:
+            rows.append(row)
+            columns.append(vocabulary.setdefault(word, len(vocabulary)))
+    
+    rows = np.array(rows, dtype=np.int64)
+    columns = np.array(columns, dtype=np.int64)
+    n_terms = len(vocabulary)
+    
+    # Count sentences per term from unique (sentence, term) pairs, then keep the most common terms
+    document_frequency = np.bincount(np.unique(rows * n_terms + columns) % max(n_terms, 1), minlength=n_terms)
+    keep = np.argsort(-document_frequency, kind="stable")[:max_features]
+    column_of_term = np.full(n_terms, -1, dtype=np.int64)
+    column_of_term[keep] = np.arange(len(keep))
+    kept = column_of_term[columns] >= 0
+    
+    counts = np.zeros((len(sentences), len(keep)), dtype=np.float32)
+    np.add.at(counts, (rows[kept], column_of_term[columns[kept]]), 1.0)
+    document_frequency = document_frequency[keep]
+    
+    idf = np.log((1 + len(sentences)) / (1 + document_frequency)) + 1.0
+    weights = np.log1p(counts) * idf
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    return weights / np.maximum(norms, 1e-10)
+
+def textrank(vectors: np.ndarray, damping: float = 0.85, iterations: int = 100, tol: float = 1e-6) -> np.ndarray:
+    """
+    PageRank scores of the cosine similarity graph of the given sentence vectors
+    
+    The similarity matrix is never materialized: each power iteration multiplies
+    through the (n_sentences, n_terms) vectors, so cost grows linearly with the
+    number of sentences.
+    """
+    n = len(vectors)
+    self_similarity = np.einsum("ij,ij->i", vectors, vectors)
+    out_weight = vectors @ vectors.sum(axis=0) - self_similarity
+    # Sentences with no similar neighbour spread their score uniformly
+    dangling = out_weight <= 1e-6
+    inverse_weight = np.where(dangling, 0.0, 1.0 / np.maximum(out_weight, 1e-6))
+    
+    scores = np.full(n, 1.0 / n, dtype=np.float32)
+    for _ in range(iterations):
+        share = scores * inverse_weight
+        flow = vectors @ (vectors.T @ share) - self_similarity * share + scores[dangling].sum() / n
+        updated = (1 - damping) / n + damping * flow
+        if np.abs(updated - scores).sum() < tol:
+            return updated
+        scores = updated
+    return scores
+
+def summarize_extractive(text: str, max_length: int = 150, min_length: int = 50) -> Dict:
+    """
+    Summarize by picking the most central sentences, without a neural model
+    
+    Sentences are ranked by TextRank over TF-IDF cosine similarity and taken in
+    rank order until min_length words are reached, skipping any that would push the
+    summary past max_length words. They are returned in their original order.
+    
+    Args:
+        text: Text to summarize
+        max_length: Maximum summary length in words
+        min_length: Minimum summary length in words
+    
+    Returns:
+        dict: Summary information
+    """
+    sentences = split_sentences(text)
+    if not sentences:
+        raise ValueError("Text has no sentences to summarize")
+    
+    vectors = tfidf_matrix(sentences)
+    scores = textrank(vectors)
+    lengths = np.array([len(sentence.split()) for sentence in sentences])
+    
+    selected, words = [], 0
+    for index in np.argsort(-scores, kind="stable"):
+        # At least one sentence, even when min_length is 0
+        if selected and words >= min_length:
+            break
+        if selected and words + lengths[index] > max_length:
+            continue
+        selected.append(index)
+        words += int(lengths[index])
+    
+    summary = " ".join(sentences[index] for index in sorted(selected))
+    original_length = len(text.split())
+    summary_length = len(summary.split())
+    return {
+        "summary": summary,
+        "original_length": original_length,
+        "summary_length": summary_length,
+        "compression_ratio": original_length / summary_length if summary_length else 0.0,
+        "sentences": len(sentences)
+    }
@@ -0,0 +1,90 @@
+import re
+from typing import List, NamedTuple, Optional, Set
+
+# A pattern that opens with a group of literal words, e.g. \b(?:by|before|until)
+_LEADING_WORDS = re.compile(r"^\\b\(\?:([a-z ]+(?:\|[a-z ]+)*)\)")
+
+def leading_chars(pattern: str) -> Optional[Set[str]]:
+    """First characters a pattern can match, when it opens with a group of literal words"""
+    match = _LEADING_WORDS.match(pattern)
+    if match is None:
+        return None
+    return {word[0] for word in match.group(1).split("|")}
+
+class SentenceMatch(NamedTuple):
+    keywords: Set[str]  # distinct action keywords found, lowercased
+    dates: List[str]  # due-date phrases, grouped by pattern in pattern order
+    imperative: bool
+
+class SentenceMatcher:
+    """
+    Scan a sentence once for action keywords, imperative words and due-date phrases
+    
+    Everything is compiled into one alternation. Date patterns come
+    first so that "by friday" is taken as a date; its leading keyword ("by") is still
+    counted. Keywords and imperative words match whole words only.
+    """
+    
+    def __init__(self, keywords: List[str], date_patterns: List[str], imperative_words: List[str]):
+        self.keywords = {keyword.lower() for keyword in keywords}
+        self.imperative_words = {word.lower() for word in imperative_words}
+        # Keywords such as "need to" that contain an imperative word
+        self.imperative_keywords = {
+            keyword for keyword in self.keywords if set(keyword.split()) & self.imperative_words
+        }
+        
+        def alternation(words):
+            # Longest first so "need to" wins over "need"
+            return "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+        
+        parts = [f"(?P<date{index}>{pattern})" for index, pattern in enumerate(date_patterns)]
+        parts.append(rf"\b(?P<keyword>{alternation(self.keywords)})\b")
+        extra_imperatives = self.imperative_words - self.keywords
+        if extra_imperatives:
+            parts.append(rf"\b(?P<imperative>{alternation(extra_imperatives)})\b")
+        
+        # Every alternative starts a word, so only try them at word starts, and where
+        # possible only at words whose first letter can begin a match
+        first_chars = {word[0] for word in self.keywords | extra_imperatives}
+        for pattern in date_patterns:
+            chars = leading_chars(pattern)
+            if chars is None:
+                first_chars = None
+                break
+            first_chars |= chars
+        start = "[" + re.escape("".join(sorted(first_chars))) + "]" if first_chars else r"\w"
+        
+        # Sentences are lowercased before scanning, which is cheaper than case-insensitive matching
+        source = rf"\b(?={start})(?:" + "|".join(parts) + ")"
+        self.pattern = re.compile(source)
+        self.ignorecase_pattern = re.compile(source, re.IGNORECASE)
+    
+    def scan(self, sentence: str) -> SentenceMatch:
+        """Find keywords, imperative words and dates in a single pass over the sentence"""
+        keywords = set()
+        dates = []
+        imperative = False
+        
+        lowered = sentence.lower()
+        if len(lowered) == len(sentence):
+            matches = self.pattern.finditer(lowered)
+        else:
+            # Lowercasing changed offsets (some non-ASCII letters), so match the original
+            matches = self.ignorecase_pattern.finditer(sentence)
+        
+        for match in matches:
+            group = match.lastgroup
+            text = sentence[match.start():match.end()]
+            if group == "keyword":
+                keywords.add(text.lower())
+            elif group == "imperative":
+                imperative = True
+            else:
+                dates.append((int(group[len("date"):]), match.start(), text))
+                first_word = text.split(None, 1)[0].lower()
+                if first_word in self.keywords:
+                    keywords.add(first_word)
+        
+        imperative = imperative or bool(keywords & self.imperative_keywords)
+        dates.sort()
+        return SentenceMatch(keywords, [text for _, _, text in dates], imperative)
@@ -1,49 +1,144 @@
-from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
 import asyncio
+import hashlib
 import logging
-from typing import List, Dict
-import torch
+import time
+from typing import List, Dict, Tuple, Optional, Callable, Awaitable
+from app.core.config import settings
+from app.core.executors import summarization_executor, configure_torch_threads
+from app.ml.batching import MicroBatcher
+from app.ml.cache import ResultCache, make_key
+from app.ml.chunking import chunk_spans, is_cut
+from app.ml.extractive import summarize_extractive
 
 logger = logging.getLogger(__name__)
 
+# torch: fp32 eager PyTorch; torch-int8: dynamically quantized Linear layers (CPU);
+# onnx: graph exported once and run with ONNX Runtime
+SUMMARIZATION_BACKENDS = ["torch", "torch-int8", "onnx"]
+
+def load_summarization_model(source: str, backend: str = "torch", onnx_dir: Optional[str] = None):
+    """
+    Load a seq2seq summarization model and its tokenizer for an inference backend
+    
+    Args:
+        source: Hub model name or local directory with the model files
+        backend: One of SUMMARIZATION_BACKENDS
+        onnx_dir: Where the exported ONNX graph is kept; exported from source on first use
+    
+    Returns:
+        tuple: (tokenizer, model)
+    """
+    import os
+    from transformers import AutoTokenizer
+    
+    if backend not in SUMMARIZATION_BACKENDS:
+        raise ValueError(f"Unknown summarization backend: {backend}")
+    
+    local_files_only = os.path.isdir(source)
+    tokenizer = AutoTokenizer.from_pretrained(source, local_files_only=local_files_only)
+    
+    if backend == "onnx":
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        
+        if onnx_dir and os.path.exists(os.path.join(onnx_dir, "config.json")):
+            return tokenizer, ORTModelForSeq2SeqLM.from_pretrained(onnx_dir, local_files_only=True)
+        
+        logger.info(f"Exporting {source} to ONNX")
+        model = ORTModelForSeq2SeqLM.from_pretrained(source, export=True, local_files_only=local_files_only)
+        if onnx_dir:
+            model.save_pretrained(onnx_dir)
+            tokenizer.save_pretrained(onnx_dir)
+        return tokenizer, model
+    
+    import torch
+    from transformers import AutoModelForSeq2SeqLM
+    
+    model = AutoModelForSeq2SeqLM.from_pretrained(source, local_files_only=local_files_only)
+    if backend == "torch-int8":
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    model.eval()
+    return tokenizer, model
+
 class MeetingSummarizer:
     """Meeting summarization using Hugging Face Transformers (BART/T5)"""
     
-    def __init__(self, model_name: str = "facebook/bart-large-cnn"):
+    # abstractive: generated by the model; extractive: central sentences picked without it
+    MODES = ["abstractive", "extractive"]
+    
+    def __init__(self, model_name: str = "facebook/bart-large-cnn", cache: Optional[ResultCache] = None,
+                 backend: str = "torch", model_dir: Optional[str] = None):
         self.model_name = model_name
+        self.backend = backend
+        self.model_dir = model_dir or None
+        self.cache = cache
         self.summarizer = None
         self.tokenizer = None
         self.model = None
-        
+        self.state = "not_loaded"  # not_loaded, loading, ready, failed
+        self._load_lock = asyncio.Lock()
+        # Chunks from all in-flight requests with the same length limits share forward passes
+        self.batcher = MicroBatcher(
+            self._summarize_batch,
+            max_batch_size=settings.SUMMARIZATION_BATCH_SIZE,
+            max_wait_ms=settings.SUMMARIZATION_BATCH_MAX_WAIT_MS,
+            executor=summarization_executor.pool
+        )
+    
+    @property
+    def name(self) -> str:
+        """Model and backend, e.g. facebook/bart-large-cnn or facebook/bart-large-cnn-onnx"""
+        return self.model_name if self.backend == "torch" else f"{self.model_name}-{self.backend}"
+    
     async def load_model(self):
         """Load summarization model asynchronously"""
-        if self.summarizer is None:
-            logger.info(f"Loading summarization model: {self.model_name}")
-            
-            loop = asyncio.get_event_loop()
-            
-            # Load model and tokenizer in thread pool
-            self.tokenizer, self.model = await loop.run_in_executor(
-                None, self._load_model_sync
-            )
-            
-            # Create pipeline
-            self.summarizer = pipeline(
-                "summarization",
-                model=self.model,
-                tokenizer=self.tokenizer,
-                device=0 if torch.cuda.is_available() else -1
-            )
-            
-            logger.info("Summarization model loaded successfully")
+        async with self._load_lock:
+            if self.summarizer is None:
+                logger.info(f"Loading summarization model: {self.name}")
+                self.state = "loading"
+                configure_torch_threads()
+                
+                loop = asyncio.get_event_loop()
+                
+                try:
+                    # Load model, tokenizer and pipeline in thread pool
+                    self.tokenizer, self.model, self.summarizer = await loop.run_in_executor(
+                        summarization_executor.pool, self._load_model_sync
+                    )
+                except Exception:
+                    self.state = "failed"
+                    raise
+                
+                self.state = "ready"
+                logger.info("Summarization model loaded successfully")
+    
+    async def warmup(self):
+        """Load the model and run one short generation so the first request is not cold"""
+        await self.load_model()
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            summarization_executor.pool,
+            lambda: self.summarizer("The team met to review the project plan.", max_length=16, min_length=4, do_sample=False)
+        )
     
     def _load_model_sync(self):
-        """Synchronously load model and tokenizer"""
-        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-        model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
-        return tokenizer, model
+        """Synchronously load model, tokenizer and summarization pipeline"""
+        import torch
+        from transformers import pipeline
+        
+        tokenizer, model = load_summarization_model(
+            self.model_dir or self.model_name, self.backend, settings.SUMMARIZATION_ONNX_DIR
+        )
+        summarizer = pipeline(
+            "summarization",
+            model=model,
+            tokenizer=tokenizer,
+            device=0 if torch.cuda.is_available() and self.backend == "torch" else -1
+        )
+        return tokenizer, model, summarizer
     
-    async def summarize_transcript(self, transcript: str, max_length: int = 150, min_length: int = 50) -> Dict:
+    async def summarize_transcript(self, transcript: str, max_length: int = 150, min_length: int = 50,
+                                   mode: str = "abstractive",
+                                   on_progress: Optional[Callable[[str, Dict], Awaitable[None]]] = None) -> Dict:
         """
         Summarize meeting transcript
         
@@ -51,84 +146,407 @@ class MeetingSummarizer:
             transcript: Meeting transcript text
             max_length: Maximum summary length
             min_length: Minimum summary length
-            
+            mode: abstractive or extractive
+            on_progress: Awaited with an event name and data as work completes:
+                "chunks" once the transcript is split, "summary" for every chunk or
+                group summary as it is produced and "level" when a tree level is done
+        
         Returns:
             dict: Summary information
         """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown summarization mode: {mode}")
+        
         try:
+            loop = asyncio.get_event_loop()
+            
+            if mode == "extractive":
+                started = time.perf_counter()
+                result = await loop.run_in_executor(
+                    None, summarize_extractive, transcript, max_length, min_length
+                )
+                return {
+                    **result,
+                    "mode": mode,
+                    "timings": {"total_seconds": time.perf_counter() - started},
+                    "cached": False
+                }
+            
+            # The same transcript with the same settings is served from the cache
+            cache_key = None
+            if self.cache is not None:
+                cache_key = make_key(
+                    "summary", transcript, self.name, max_length, min_length,
+                    settings.SUMMARIZATION_CHUNK_TOKENS, settings.SUMMARIZATION_CHUNK_OVERLAP,
+                    settings.SUMMARIZATION_REDUCE_FAN_IN
+                )
+                cached = await loop.run_in_executor(None, self.cache.get, cache_key)
+                if cached is not None:
+                    logger.info("Summary served from cache")
+                    return {**cached, "cached": True}
+            
             if self.summarizer is None:
                 await self.load_model()
             
             logger.info("Starting transcript summarization")
+            started = time.perf_counter()
             
-            # Split long transcripts into chunks if needed
-            chunks = self._split_text(transcript, max_chunk_length=1024)
+            # Split long transcripts into chunks that fit the model's context
+            chunks = await loop.run_in_executor(None, self._split_text, transcript)
+            chunked = time.perf_counter()
+            logger.info(f"Summarizing {len(chunks)} chunks")
+            if on_progress is not None:
+                await on_progress("chunks", {"count": len(chunks)})
             
-            summaries = []
-            for chunk in chunks:
-                # Run summarization in thread pool
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None, 
-                    lambda: self.summarizer(
-                        chunk,
-                        max_length=max_length,
-                        min_length=min_length,
-                        do_sample=False
-                    )
-                )
-                summaries.append(result[0]['summary_text'])
+            # Map: summarize every chunk
+            levels = []
+            summaries = await self._summarize_level(
+                [[chunk] for chunk in chunks], max_length, min_length, levels, on_progress
+            )
+            
+            # Reduce: summarize neighbouring summaries until a single one is left
+            while len(summaries) > 1:
+                groups = self._group_summaries(summaries)
+                if len(groups) == 1:
+                    summaries = await self._summarize_level(groups, 200, 100, levels, on_progress)
+                else:
+                    summaries = await self._summarize_level(groups, max_length, min_length, levels, on_progress)
             
-            # If multiple chunks, summarize the summaries
-            final_summary = summaries[0] if len(summaries) == 1 else await self._combine_summaries(summaries)
+            final_summary = summaries[0]
+            finished = time.perf_counter()
             
-            logger.info("Summarization completed successfully")
+            logger.info(f"Summarization completed successfully in {finished - started:.2f}s over {len(levels)} levels")
             
-            return {
+            result = {
                 "summary": final_summary,
                 "original_length": len(transcript.split()),
                 "summary_length": len(final_summary.split()),
-                "compression_ratio": len(transcript.split()) / len(final_summary.split())
+                "compression_ratio": len(transcript.split()) / len(final_summary.split()),
+                "mode": mode,
+                "chunks": len(chunks),
+                "levels": levels,
+                "timings": {
+                    "chunking_seconds": chunked - started,
+                    "total_seconds": finished - started
+                }
             }
             
+            if cache_key is not None:
+                await loop.run_in_executor(None, self.cache.set, cache_key, result)
+            
+            return {**result, "cached": False}
+            
         except Exception as e:
             logger.error(f"Summarization failed: {str(e)}")
             raise Exception(f"Summarization failed: {str(e)}")
     
-    def _split_text(self, text: str, max_chunk_length: int = 1024) -> List[str]:
-        """Split text into chunks for processing"""
-        words = text.split()
-        chunks = []
-        current_chunk = []
+    async def summarize_incremental(self, transcript: str, state: Optional[Dict] = None,
+                                    max_length: int = 150, min_length: int = 50) -> Tuple[Dict, Dict]:
+        """
+        Summarize a growing transcript, reusing the work recorded in state
         
-        for word in words:
-            current_chunk.append(word)
-            if len(' '.join(current_chunk)) > max_chunk_length:
-                chunks.append(' '.join(current_chunk[:-1]))
-                current_chunk = [word]
+        Chunks are only ever appended: every chunk but the last is closed, and its
+        summary is kept along with the character offset it covers. Reduce groups are
+        positional runs of SUMMARIZATION_REDUCE_FAN_IN items; a full group of closed
+        items is closed too and its summary kept. An update therefore summarizes the
+        new tail, the newly closed groups and the one open group per level.
         
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+        The state is discarded when the generation settings differ or the text before
+        the covered offset has changed.
         
-        return chunks
+        Args:
+            transcript: Full meeting transcript text
+            state: State returned by the previous call for this transcript, if any
+            max_length: Maximum summary length
+            min_length: Minimum summary length
+        
+        Returns:
+            Tuple[Dict, Dict]: Summary information and the state for the next call
+        """
+        try:
+            if self.summarizer is None:
+                await self.load_model()
+            
+            loop = asyncio.get_event_loop()
+            started = time.perf_counter()
+            params = make_key(
+                "incremental", self.name, max_length, min_length,
+                settings.SUMMARIZATION_CHUNK_TOKENS, settings.SUMMARIZATION_REDUCE_FAN_IN
+            )
+            
+            covered, closed_chunks, closed_levels = 0, [], []
+            if state and state.get("params") == params:
+                prefix_hash = hashlib.sha256(transcript[:state["covered"]].encode("utf-8")).hexdigest()
+                if len(transcript) >= state["covered"] and prefix_hash == state["prefix_hash"]:
+                    covered = state["covered"]
+                    closed_chunks = list(state["chunks"])
+                    closed_levels = [list(level) for level in state["levels"]]
+                else:
+                    logger.info("Transcript changed within the summarized range, starting over")
+            reused_chunks = len(closed_chunks)
+            
+            # Map: only the text after the last closed chunk
+            tail = transcript[covered:]
+            spans = await loop.run_in_executor(
+                None, lambda: chunk_spans(tail, self.tokenizer, self._max_chunk_tokens())
+            )
+            tail_summaries, cache_hits = await self._summarize_chunks(
+                [tail[start:end] for start, end in spans], max_length, min_length
+            )
+            levels = [{
+                "level": 0,
+                "inputs": len(spans),
+                "model_calls": len(spans) - cache_hits,
+                "cache_hits": cache_hits,
+                "seconds": time.perf_counter() - started
+            }]
+            
+            # Every tail chunk but the last is final; the last may still grow
+            if len(spans) > 1:
+                closed_chunks.extend(tail_summaries[:-1])
+                covered += spans[-1][0]
+            closed, open_items = closed_chunks, tail_summaries[-1:]
+            
+            # Reduce: positional groups, recomputing only what is new or still open
+            budget = self._max_chunk_tokens() - self.tokenizer.num_special_tokens_to_add()
+            fan_in = max(2, min(settings.SUMMARIZATION_REDUCE_FAN_IN, budget // max(max_length, 1)))
+            
+            depth = 0
+            while len(closed) + len(open_items) > 1:
+                level_started = time.perf_counter()
+                if len(closed_levels) <= depth:
+                    closed_levels.append([])
+                done = closed_levels[depth]
+                
+                full_groups = len(closed) // fan_in
+                new_groups = [closed[index * fan_in:(index + 1) * fan_in] for index in range(len(done), full_groups)]
+                remainder = closed[full_groups * fan_in:] + open_items
+                open_groups = [remainder[index:index + fan_in] for index in range(0, len(remainder), fan_in)]
+                
+                # Closed summaries are reused at any depth, so only an open root gets the final lengths
+                is_root = full_groups + len(open_groups) == 1
+                open_lengths = (200, 100) if is_root else (max_length, min_length)
+                pending_open = [' '.join(group) for group in open_groups if len(group) > 1]
+                
+                (closed_summaries, closed_hits), (open_summaries, open_hits) = await asyncio.gather(
+                    self._summarize_chunks([' '.join(group) for group in new_groups], max_length, min_length),
+                    self._summarize_chunks(pending_open, *open_lengths)
+                )
+                
+                done.extend(closed_summaries)
+                open_summaries = iter(open_summaries)
+                open_items = [next(open_summaries) if len(group) > 1 else group[0] for group in open_groups]
+                closed = done
+                
+                depth += 1
+                calls = len(new_groups) + len(pending_open)
+                levels.append({
+                    "level": depth,
+                    "inputs": full_groups * fan_in + len(remainder),
+                    "closed_groups": len(done),
+                    "model_calls": calls - closed_hits - open_hits,
+                    "cache_hits": closed_hits + open_hits,
+                    "seconds": time.perf_counter() - level_started
+                })
+            
+            final_summary = (closed + open_items)[0]
+            finished = time.perf_counter()
+            logger.info(
+                f"Incremental summarization of {len(tail)} new characters completed in {finished - started:.2f}s"
+            )
+            
+            result = {
+                "summary": final_summary,
+                "original_length": len(transcript.split()),
+                "summary_length": len(final_summary.split()),
+                "compression_ratio": len(transcript.split()) / len(final_summary.split()),
+                "mode": "abstractive",
+                "chunks": len(closed_chunks) + len(tail_summaries[-1:]),
+                "levels": levels,
+                "incremental": {
+                    "reused_chunks": reused_chunks,
+                    "new_characters": len(tail),
+                    "covered_characters": covered
+                },
+                "timings": {"total_seconds": finished - started},
+                "cached": False
+            }
+            new_state = {
+                "params": params,
+                "covered": covered,
+                "prefix_hash": hashlib.sha256(transcript[:covered].encode("utf-8")).hexdigest(),
+                "chunks": closed_chunks,
+                "levels": closed_levels
+            }
+            return result, new_state
+        
+        except Exception as e:
+            logger.error(f"Incremental summarization failed: {str(e)}")
+            raise Exception(f"Summarization failed: {str(e)}")
     
-    async def _combine_summaries(self, summaries: List[str]) -> str:
-        """Combine multiple summaries into one final summary"""
-        combined = ' '.join(summaries)
+    def _split_text(self, text: str) -> List[str]:
+        """Split text into sentence-aligned chunks of at most SUMMARIZATION_CHUNK_TOKENS model tokens"""
+        spans = chunk_spans(text, self.tokenizer, self._max_chunk_tokens(), settings.SUMMARIZATION_CHUNK_OVERLAP)
+        return [text[start:end] for start, end in spans]
+    
+    async def _summarize_chunks(self, chunks: List[str], max_length: int, min_length: int,
+                                on_summary: Optional[Callable[[int, str], Awaitable[None]]] = None) -> Tuple[List[str], int]:
+        """
+        Summarize chunks through the shared batcher, preserving their order
+        
+        Chunks summarized before with the same settings are taken from the cache, so an
+        edited transcript only re-runs the chunks (and reduce groups) that changed.
+        on_summary is awaited with each chunk's index and summary as soon as it is ready.
         
-        # Summarize the combined summaries
+        Returns:
+            Tuple[List[str], int]: Summaries and how many of them were cache hits
+        """
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: self.summarizer(
-                combined,
-                max_length=200,
-                min_length=100,
-                do_sample=False
+        cached = [None] * len(chunks)
+        if self.cache is not None:
+            keys = [make_key("chunk", chunk, self.name, max_length, min_length) for chunk in chunks]
+            cached = await loop.run_in_executor(None, lambda: [self.cache.get(key) for key in keys])
+        
+        summaries = [entry["summary"] if entry is not None else None for entry in cached]
+        misses = [index for index, summary in enumerate(summaries) if summary is None]
+        if on_summary is not None:
+            for index, summary in enumerate(summaries):
+                if summary is not None:
+                    await on_summary(index, summary)
+        
+        async def summarize(index: int):
+            summaries[index] = await self.batcher.submit(chunks[index], key=(max_length, min_length))
+            if on_summary is not None:
+                await on_summary(index, summaries[index])
+        
+        await asyncio.gather(*[summarize(index) for index in misses])
+        
+        if self.cache is not None:
+            await loop.run_in_executor(None, lambda: [
+                self.cache.set(keys[index], {"summary": summaries[index]}) for index in misses
+            ])
+        return summaries, len(chunks) - len(misses)
+    
+    def _summarize_batch(self, texts: List[str], lengths: Tuple[int, int]) -> List[str]:
+        """
+        Summarize texts in padded sub-batches
+        
+        Texts are sorted by token count so that similar lengths share a forward pass,
+        then grouped up to SUMMARIZATION_BATCH_SIZE texts while the padded input plus
+        output tokens of a group stay under SUMMARIZATION_BATCH_MAX_TOKENS.
+        """
+        max_length, min_length = lengths
+        token_counts = [len(ids) for ids in self.tokenizer(texts, truncation=True)["input_ids"]]
+        order = sorted(range(len(texts)), key=lambda index: token_counts[index])
+        
+        groups, group = [], []
+        for index in order:
+            # Sorted ascending, so the newest text sets the padded length of the group
+            padded_tokens = (len(group) + 1) * (token_counts[index] + max_length)
+            if group and (len(group) >= settings.SUMMARIZATION_BATCH_SIZE
+                          or padded_tokens > settings.SUMMARIZATION_BATCH_MAX_TOKENS):
+                groups.append(group)
+                group = []
+            group.append(index)
+        if group:
+            groups.append(group)
+        
+        summaries = [None] * len(texts)
+        for group in groups:
+            results = self.summarizer(
+                [texts[index] for index in group],
+                max_length=max_length,
+                min_length=min_length,
+                do_sample=False,
+                truncation=True,
+                batch_size=len(group)
             )
+            for index, result in zip(group, results):
+                if isinstance(result, list):
+                    result = result[0]
+                summaries[index] = result['summary_text']
+        
+        return summaries
+    
+    def _max_chunk_tokens(self) -> int:
+        return min(settings.SUMMARIZATION_CHUNK_TOKENS, self.tokenizer.model_max_length)
+    
+    def _group_summaries(self, summaries: List[str]) -> List[List[str]]:
+        """
+        Group consecutive summaries for the next reduce level
+        
+        A group holds at most SUMMARIZATION_REDUCE_FAN_IN summaries and, once it has
+        two, is closed before the joined text would exceed the chunk token budget, or
+        after a summary is_cut picks from its own text. Unchanged summaries away from
+        an edit therefore keep their groups, and their cached reduce summaries.
+        """
+        max_tokens = self._max_chunk_tokens() - self.tokenizer.num_special_tokens_to_add()
+        token_counts = [len(ids) for ids in self.tokenizer(summaries, add_special_tokens=False)["input_ids"]]
+        fan_in = max(2, settings.SUMMARIZATION_REDUCE_FAN_IN)
+        
+        groups, group, group_tokens = [], [], 0
+        for summary, tokens in zip(summaries, token_counts):
+            # Every group takes at least two summaries so each level shrinks
+            if len(group) >= fan_in or (len(group) >= 2 and group_tokens + tokens > max_tokens):
+                groups.append(group)
+                group, group_tokens = [], 0
+            group.append(summary)
+            group_tokens += tokens
+            if len(group) >= 2 and is_cut(summary, 1, fan_in - 1):
+                groups.append(group)
+                group, group_tokens = [], 0
+        if group:
+            groups.append(group)
+        
+        return groups
+    
+    async def _summarize_level(self, groups: List[List[str]], max_length: int, min_length: int,
+                               levels: List[Dict],
+                               on_progress: Optional[Callable[[str, Dict], Awaitable[None]]] = None) -> List[str]:
+        """
+        Summarize each group of texts in parallel and record the level's stats
+        
+        Groups of several texts are joined first. On reduce levels a lone summary is
+        carried up unchanged rather than summarized again.
+        """
+        started = time.perf_counter()
+        level = len(levels)
+        
+        pending = [index for index, group in enumerate(groups) if len(group) > 1 or level == 0]
+        
+        on_summary = None
+        if on_progress is not None:
+            async def on_summary(position: int, summary: str):
+                await on_progress("summary", {"level": level, "index": pending[position], "summary": summary})
+        
+        results, cache_hits = await self._summarize_chunks(
+            [' '.join(groups[index]) for index in pending], max_length, min_length, on_summary
         )
+        outputs = [group[0] for group in groups]
+        for index, summary in zip(pending, results):
+            outputs[index] = summary
+        
+        input_words = sum(len(text.split()) for group in groups for text in group)
+        output_words = sum(len(summary.split()) for summary in outputs)
+        levels.append({
+            "level": level,
+            "inputs": sum(len(group) for group in groups),
+            "outputs": len(outputs),
+            "model_calls": len(pending) - cache_hits,
+            "cache_hits": cache_hits,
+            "input_words": input_words,
+            "output_words": output_words,
+            "compression_ratio": input_words / output_words if output_words else 0.0,
+            "seconds": time.perf_counter() - started
+        })
+        if on_progress is not None:
+            await on_progress("level", levels[-1])
         
-        return result[0]['summary_text']
+        return outputs
 
 # Global summarizer instance
-summarizer = MeetingSummarizer()
\ No newline at end of file
+summarizer = MeetingSummarizer(
+    cache=ResultCache(settings.SUMMARIZATION_CACHE_DIR, settings.SUMMARIZATION_CACHE_MAX_BYTES),
+    backend=settings.SUMMARIZATION_BACKEND,
+    model_dir=settings.SUMMARIZATION_MODEL_DIR
+)
\ No newline at end of file
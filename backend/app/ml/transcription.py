@@ -1,58 +1,287 @@
-import whisper
-import torch
 import asyncio
 import logging
-from typing import Optional
+from typing import Optional, List, Dict, Callable, Awaitable, Tuple
 import os
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import numpy as np
+
+from app.core.config import settings
+from app.core.executors import transcription_executor, configure_torch_threads
+from app.ml.cache import ResultCache, hash_file, make_key
+from app.ml.vad import SpeechMap, detect_speech, frame_energy
+from app.ml.audio import SAMPLE_RATE, decoded_path, load_decoded
+from app.ml.batching import MicroBatcher
 
 logger = logging.getLogger(__name__)
 
+# Length of the audio window Whisper decodes at once, in seconds
+WHISPER_WINDOW_SECONDS = 30
+
+# whisper and torch are imported where they are used so that importing this module,
+# and the routers that depend on it, does not pull in the ML stack at startup
+
+# Whisper model held by each chunk worker process
+_worker_model = None
+
+class TranscriptionInProgress(Exception):
+    """Another run holds the meeting's transcription lease"""
+
+def load_whisper_model(model_size: str, quantized: bool = False, device: Optional[str] = None):
+    """
+    Load a Whisper model, optionally as a CPU int8 dynamically quantized variant
+    
+    Whisper's Linear subclass only adds dtype casting for fp16 inference, so on CPU
+    it is swapped for torch.nn.Linear to let quantize_dynamic replace every projection.
+    """
+    import torch
+    import whisper
+    
+    if not quantized:
+        return whisper.load_model(model_size, device=device)
+    
+    model = whisper.load_model(model_size, device="cpu")
+    for module in model.modules():
+        if type(module) is whisper.model.Linear:
+            module.__class__ = torch.nn.Linear
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+def _init_chunk_worker(model_size: str, quantized: bool):
+    """Load the Whisper model once per worker process"""
+    global _worker_model
+    import torch
+    
+    # Each worker gets a single torch thread so the pool does not oversubscribe the CPU
+    torch.set_num_threads(1)
+    _worker_model = load_whisper_model(model_size, quantized, device="cpu")
+
+def _transcribe_chunk(npy_path: str, start: int, end: int, offset: float, language: str,
+                      decode_options: Dict) -> List[Dict]:
+    """
+    Transcribe samples start:end of a memory-mapped audio array in a worker process
+    
+    offset is where the window begins on the audio being transcribed, in seconds, which
+    differs from start / SAMPLE_RATE when that audio begins partway into the file.
+    """
+    # Workers map the shared array themselves, so no samples are pickled across processes
+    audio = np.ascontiguousarray(np.load(npy_path, mmap_mode="r")[start:end])
+    result = _worker_model.transcribe(audio, language=language, verbose=None, **decode_options)
+    return [
+        {
+            "start": segment["start"] + offset,
+            "end": segment["end"] + offset,
+            "text": segment["text"]
+        }
+        for segment in result["segments"]
+    ]
+
+def split_on_silence(audio: np.ndarray, window_seconds: float, search_seconds: float = 10.0,
+                     frame_ms: int = 30) -> List[int]:
+    """
+    Find chunk boundaries close to every window_seconds, snapped to the quietest frame nearby
+    
+    Args:
+        audio: 16 kHz mono float32 samples
+        window_seconds: Target length of each chunk
+        search_seconds: How far around each target boundary to look for silence
+        frame_ms: Energy frame length in milliseconds
+    
+    Returns:
+        List[int]: Sample offsets of the chunk starts, beginning with 0
+    """
+    frame_length = SAMPLE_RATE * frame_ms // 1000
+    n_frames = len(audio) // frame_length
+    window_frames = int(window_seconds * 1000 / frame_ms)
+    
+    if n_frames <= window_frames:
+        return [0]
+    
+    energy = frame_energy(audio, frame_length)
+    
+    search_frames = int(search_seconds * 1000 / frame_ms)
+    boundaries = [0]
+    target = window_frames
+    
+    while target < n_frames - search_frames:
+        low = max(boundaries[-1] + 1, target - search_frames)
+        high = min(n_frames, target + search_frames)
+        cut = low + int(np.argmin(energy[low:high]))
+        boundaries.append(cut)
+        target = cut + window_frames
+    
+    return [frame * frame_length for frame in boundaries]
+
 class WhisperTranscriber:
     """OpenAI Whisper speech-to-text transcriber"""
     
-    def __init__(self, model_size: str = "base"):
+    def __init__(self, model_size: str = "base", cache: Optional[ResultCache] = None, quantized: bool = False):
         self.model_size = model_size
+        self.quantized = quantized
         self.model = None
-        
+        self.state = "not_loaded"  # not_loaded, loading, ready, failed
+        self._load_lock = asyncio.Lock()
+        self.cache = cache
+        self.in_flight = 0
+        self.use_vad = settings.TRANSCRIPTION_VAD_ENABLED
+        self.scheduler = TranscriptionScheduler(
+            self,
+            max_batch_size=settings.TRANSCRIPTION_BATCH_SIZE,
+            max_wait_ms=settings.TRANSCRIPTION_BATCH_MAX_WAIT_MS
+        ) if settings.TRANSCRIPTION_BATCHING_ENABLED else None
+        # Options forwarded to model.transcribe; part of the cache key
+        self.decode_options = {"task": "transcribe"}
+        self._chunk_pool = None
+    
+    @property
+    def name(self) -> str:
+        """Model variant identifier, e.g. base or small-int8"""
+        return f"{self.model_size}-int8" if self.quantized else self.model_size
+    
+    @property
+    def queue_depth(self) -> int:
+        """Requests currently handled by this model"""
+        return self.in_flight
+    
     async def load_model(self):
         """Load Whisper model asynchronously"""
-        if self.model is None:
-            logger.info(f"Loading Whisper {self.model_size} model...")
-            # Run model loading in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            self.model = await loop.run_in_executor(
-                None, whisper.load_model, self.model_size
-            )
-            logger.info("Whisper model loaded successfully")
+        async with self._load_lock:
+            if self.model is None:
+                logger.info(f"Loading Whisper {self.name} model...")
+                self.state = "loading"
+                configure_torch_threads()
+                try:
+                    # Run model loading in thread pool to avoid blocking
+                    loop = asyncio.get_event_loop()
+                    self.model = await loop.run_in_executor(
+                        transcription_executor.pool, load_whisper_model, self.model_size, self.quantized
+                    )
+                except Exception:
+                    self.state = "failed"
+                    raise
+                self.state = "ready"
+                logger.info("Whisper model loaded successfully")
+    
+    async def warmup(self):
+        """Load the model and run one short decode so the first request is not cold"""
+        await self.load_model()
+        await self.transcribe_window(np.zeros(SAMPLE_RATE, dtype=np.float32), 0.0, language="en")
     
-    async def transcribe_audio(self, audio_path: str) -> dict:
+    async def transcribe_audio(self, audio_path: str, chunked: Optional[bool] = None, start_offset: float = 0.0,
+                               on_checkpoint: Optional[Callable[[List[Dict], float], Awaitable[None]]] = None) -> dict:
         """
         Transcribe audio file to text
         
         Args:
             audio_path: Path to audio file
-            
+            chunked: Split the audio at silences and transcribe the chunks in parallel.
+                Defaults to chunking recordings longer than TRANSCRIPTION_CHUNKED_MIN_SECONDS.
+            start_offset: Resume from this position, in seconds; earlier audio is skipped
+            on_checkpoint: Awaited with each run of completed segments and the offset
+                transcription can later resume from, in recording order
+        
         Returns:
-            dict: Transcription result with text and segments
+            dict: Transcription result with text and segments from start_offset onwards
         """
+        self.in_flight += 1
         try:
-            if self.model is None:
-                await self.load_model()
-            
             if not os.path.exists(audio_path):
                 raise FileNotFoundError(f"Audio file not found: {audio_path}")
             
+            loop = asyncio.get_event_loop()
+            
+            # Identical audio with identical settings is served from the cache
+            cache_key = None
+            if self.cache is not None and start_offset == 0:
+                content_hash = await loop.run_in_executor(None, hash_file, audio_path)
+                cache_key = make_key(
+                    content_hash, self.name, self.decode_options, chunked,
+                    self.use_vad, self.scheduler is not None
+                )
+                cached = await loop.run_in_executor(None, self.cache.get, cache_key)
+                if cached is not None:
+                    logger.info(f"Transcription cache hit for: {audio_path}")
+                    return {**cached, "cached": True}
+            
+            if self.model is None:
+                await self.load_model()
+            
             logger.info(f"Starting transcription for: {audio_path}")
             
-            # Run transcription in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self._transcribe_sync, audio_path
+            # Decoded samples are memory-mapped from the cached .npy next to the upload
+            audio = await loop.run_in_executor(
+                None, load_decoded, audio_path
             )
+            duration = len(audio) / SAMPLE_RATE
+            resume_sample = int(start_offset * SAMPLE_RATE)
+            audio = audio[resume_sample:]
+            # Chunk workers can read these samples straight from the decoded file
+            source = (decoded_path(audio_path), resume_sample)
+            
+            # Only send speech to the model; timestamps are mapped back afterwards
+            speech_map = None
+            if self.use_vad and len(audio) > 0:
+                regions = await loop.run_in_executor(None, detect_speech, audio)
+                speech_map = SpeechMap(regions, len(audio))
+                if speech_map.speech_samples < settings.TRANSCRIPTION_VAD_MIN_SPEECH_FRACTION * len(audio):
+                    # Steady noise under continuous talk can hide all speech from the
+                    # energy threshold, so a near-empty map is not trusted
+                    logger.info(
+                        f"VAD found {1 - speech_map.skipped_fraction:.1%} speech, transcribing all of the audio"
+                    )
+                    speech_map = None
+                else:
+                    audio = speech_map.compact(audio)
+                    source = None
+                    logger.info(f"VAD skipped {speech_map.skipped_fraction:.1%} of the audio")
+            
+            def to_timeline(seconds: float, side: str = "end") -> float:
+                """Map a time on the decoded audio back to the recording timeline"""
+                if speech_map is not None:
+                    seconds = speech_map.to_original(seconds, side)
+                return seconds + start_offset
+            
+            async def checkpoint(segments: List[Dict], end: float):
+                if on_checkpoint is not None:
+                    await on_checkpoint(
+                        [
+                            {"start": to_timeline(s["start"], "start"), "end": to_timeline(s["end"]), "text": s["text"]}
+                            for s in segments
+                        ],
+                        to_timeline(end)
+                    )
+            
+            if chunked is None:
+                chunked = (
+                    settings.TRANSCRIPTION_CHUNK_WORKERS > 1
+                    and len(audio) / SAMPLE_RATE >= settings.TRANSCRIPTION_CHUNKED_MIN_SECONDS
+                )
+            
+            if len(audio) == 0:
+                result = {"text": "", "segments": [], "language": None}
+                # Nothing was transcribed, so there is nothing worth serving again
+                cache_key = None
+            elif chunked:
+                result = await self._transcribe_chunked(audio, checkpoint, source)
+            elif on_checkpoint is not None and len(audio) / SAMPLE_RATE > settings.TRANSCRIPTION_CHUNK_SECONDS:
+                # Window by window so completed work survives a restart
+                result = await self._transcribe_sequential(audio, checkpoint)
+            elif self.scheduler is not None:
+                # Windows are decoded together with those of other in-flight requests
+                result = await self.scheduler.transcribe(audio)
+            else:
+                # Run transcription in thread pool to avoid blocking
+                result = await loop.run_in_executor(
+                    transcription_executor.pool, self._transcribe_sync, audio
+                )
+            
+            for segment in result["segments"]:
+                segment["start"] = to_timeline(segment["start"], "start")
+                segment["end"] = to_timeline(segment["end"])
             
             logger.info("Transcription completed successfully")
-            return {
+            transcription = {
                 "text": result["text"],
                 "segments": [
                     {
@@ -62,16 +291,474 @@ class WhisperTranscriber:
                     }
                     for segment in result["segments"]
                 ],
-                "language": result["language"]
+                "language": result["language"],
+                "duration": duration,
+                "skipped_fraction": speech_map.skipped_fraction if speech_map is not None else 0.0
             }
             
+            if cache_key is not None:
+                await loop.run_in_executor(None, self.cache.set, cache_key, transcription)
+            
+            return {**transcription, "cached": False}
+        
+        except TranscriptionInProgress:
+            # Raised by on_checkpoint when another run took over; the caller handles it
+            raise
         except Exception as e:
             logger.error(f"Transcription failed: {str(e)}")
             raise Exception(f"Transcription failed: {str(e)}")
+        finally:
+            self.in_flight -= 1
     
-    def _transcribe_sync(self, audio_path: str):
+    def _transcribe_sync(self, audio: np.ndarray):
         """Synchronous transcription method"""
-        return self.model.transcribe(audio_path, verbose=True)
+        return self.model.transcribe(audio, verbose=True, **self.decode_options)
+    
+    async def transcribe_window(self, audio: np.ndarray, offset: float, language: Optional[str] = None) -> dict:
+        """
+        Transcribe an in-memory audio window
+        
+        Args:
+            audio: 16 kHz mono float32 samples
+            offset: Position of the window on the recording timeline, in seconds
+            language: Language code, detected from the window when omitted
+        
+        Returns:
+            dict: Segments with timestamps on the recording timeline and the language
+        """
+        if self.model is None:
+            await self.load_model()
+        
+        loop = asyncio.get_event_loop()
+        result = await loop.run_in_executor(
+            transcription_executor.pool,
+            lambda: self.model.transcribe(audio, language=language, verbose=None, **self.decode_options)
+        )
+        
+        return {
+            "segments": [
+                {
+                    "start": segment["start"] + offset,
+                    "end": segment["end"] + offset,
+                    "text": segment["text"]
+                }
+                for segment in result["segments"]
+            ],
+            "language": result["language"]
+        }
+    
+    async def _transcribe_sequential(self, audio: np.ndarray,
+                                     on_chunk: Callable[[List[Dict], float], Awaitable[None]]) -> dict:
+        """Transcribe silence-aligned chunks one after another, reporting each as it completes"""
+        loop = asyncio.get_event_loop()
+        language = await loop.run_in_executor(transcription_executor.pool, self._detect_language, audio)
+        
+        starts = split_on_silence(audio, settings.TRANSCRIPTION_CHUNK_SECONDS)
+        ends = starts[1:] + [len(audio)]
+        
+        segments = []
+        for start, end in zip(starts, ends):
+            window = await self.transcribe_window(audio[start:end], start / SAMPLE_RATE, language)
+            segments.extend(window["segments"])
+            await on_chunk(window["segments"], end / SAMPLE_RATE)
+        
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": language
+        }
+    
+    async def _transcribe_chunked(self, audio: np.ndarray,
+                                  on_chunk: Optional[Callable[[List[Dict], float], Awaitable[None]]] = None,
+                                  source: Optional[Tuple[str, int]] = None) -> dict:
+        """
+        Transcribe silence-aligned chunks across the worker pool and stitch the results
+        
+        source is the .npy file audio was read from and the sample audio starts at in
+        it. Without one, audio is spilled to a temporary file for the workers.
+        """
+        loop = asyncio.get_event_loop()
+        
+        # Detect the language once so every chunk is decoded consistently
+        language = await loop.run_in_executor(transcription_executor.pool, self._detect_language, audio)
+        
+        starts = split_on_silence(audio, settings.TRANSCRIPTION_CHUNK_SECONDS)
+        ends = starts[1:] + [len(audio)]
+        logger.info(f"Transcribing {len(starts)} chunks with {settings.TRANSCRIPTION_CHUNK_WORKERS} workers")
+        
+        # Workers share the array through a file; audio built in memory (e.g. after VAD) is spilled once
+        temp_path = None
+        if source is not None:
+            npy_path, base = source
+        else:
+            fd, temp_path = tempfile.mkstemp(suffix=".npy")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, audio)
+            npy_path, base = temp_path, 0
+        
+        pending = set()
+        try:
+            pool = self._get_chunk_pool()
+            futures = [
+                loop.run_in_executor(
+                    pool, _transcribe_chunk, npy_path, base + start, base + end,
+                    start / SAMPLE_RATE, language, self.decode_options
+                )
+                for start, end in zip(starts, ends)
+            ]
+            chunk_index = {future: index for index, future in enumerate(futures)}
+            chunk_segments = [None] * len(futures)
+            next_chunk = 0
+            pending = set(futures)
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    chunk_segments[chunk_index[future]] = future.result()
+                
+                # Report chunks in order so the resume offset only ever covers finished work
+                while next_chunk < len(futures) and chunk_segments[next_chunk] is not None:
+                    if on_chunk is not None:
+                        await on_chunk(chunk_segments[next_chunk], ends[next_chunk] / SAMPLE_RATE)
+                    next_chunk += 1
+        finally:
+            # Chunks not started yet are dropped when a chunk or a checkpoint fails
+            for future in pending:
+                future.cancel()
+            if temp_path is not None:
+                os.unlink(temp_path)
+        
+        segments = [segment for chunk in chunk_segments for segment in chunk]
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": language
+        }
+    
+    def _detect_language(self, audio: np.ndarray) -> str:
+        """Detect the spoken language from the first 30 seconds of audio"""
+        import whisper
+        
+        mel = whisper.log_mel_spectrogram(
+            whisper.pad_or_trim(audio), n_mels=self.model.dims.n_mels
+        ).to(self.model.device)
+        _, probs = self.model.detect_language(mel)
+        return max(probs, key=probs.get)
+    
+    def _get_chunk_pool(self) -> ProcessPoolExecutor:
+        """Create the chunk worker pool on first use"""
+        if self._chunk_pool is None:
+            self._chunk_pool = ProcessPoolExecutor(
+                max_workers=settings.TRANSCRIPTION_CHUNK_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_chunk_worker,
+                initargs=(self.model_size, self.quantized)
+            )
+        return self._chunk_pool
+
+class TranscriptionScheduler:
+    """
+    Dynamic batching of 30-second windows across concurrent transcriptions
+    
+    Each request is cut into windows of at most 30 seconds at quiet frames. Windows
+    from every in-flight request are queued together and decoded as one batched
+    whisper.decode call per language, and each window's segments are routed back to
+    the request it came from. Batched decoding skips Whisper's temperature fallback,
+    trading a little robustness on difficult audio for throughput under load.
+    """
+    
+    def __init__(self, transcriber: "WhisperTranscriber", max_batch_size: int = 8, max_wait_ms: float = 50.0):
+        self.transcriber = transcriber
+        self.window_seconds = WHISPER_WINDOW_SECONDS
+        self._batcher = MicroBatcher(
+            self._decode_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            executor=transcription_executor.pool
+        )
+    
+    @property
+    def depth(self) -> int:
+        """Windows waiting for or undergoing decoding"""
+        return self._batcher.depth
+    
+    async def transcribe(self, audio: np.ndarray, language: Optional[str] = None) -> dict:
+        """
+        Transcribe audio through the shared batch queue
+        
+        Args:
+            audio: 16 kHz mono float32 samples
+            language: Language code, detected from the first window when omitted
+        
+        Returns:
+            dict: Result with text, segments and language like model.transcribe
+        """
+        loop = asyncio.get_event_loop()
+        if language is None:
+            language = await loop.run_in_executor(
+                transcription_executor.pool, self.transcriber._detect_language, audio
+            )
+        
+        # Leave room for the boundary search so no window exceeds Whisper's 30 seconds
+        starts = split_on_silence(audio, self.window_seconds - 2, search_seconds=2)
+        ends = starts[1:] + [len(audio)]
+        
+        window_segments = await asyncio.gather(*[
+            self._batcher.submit(audio[start:end], key=language)
+            for start, end in zip(starts, ends)
+        ])
+        
+        segments = []
+        for start, window in zip(starts, window_segments):
+            offset = start / SAMPLE_RATE
+            for segment in window:
+                segments.append({
+                    "start": segment["start"] + offset,
+                    "end": segment["end"] + offset,
+                    "text": segment["text"]
+                })
+        
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": language
+        }
+    
+    def _decode_batch(self, windows: List[np.ndarray], language: str) -> List[List[Dict]]:
+        """Decode a batch of windows in a single forward pass"""
+        import torch
+        import whisper
+        
+        model = self.transcriber.model
+        task = self.transcriber.decode_options.get("task", "transcribe")
+        
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(np.asarray(window)), n_mels=model.dims.n_mels)
+            for window in windows
+        ]).to(model.device)
+        
+        options = whisper.DecodingOptions(
+            task=task,
+            language=language,
+            without_timestamps=False,
+            fp16=model.device.type == "cuda"
+        )
+        results = whisper.decode(model, mel, options)
+        
+        tokenizer = whisper.tokenizer.get_tokenizer(
+            model.is_multilingual, num_languages=model.num_languages, language=language, task=task
+        )
+        return [
+            self._segments_from_tokens(result.tokens, tokenizer, len(window) / SAMPLE_RATE)
+            for result, window in zip(results, windows)
+        ]
+    
+    @staticmethod
+    def _segments_from_tokens(tokens: List[int], tokenizer, window_duration: float) -> List[Dict]:
+        """Split decoded tokens into segments at Whisper's timestamp tokens"""
+        import whisper
+        
+        time_precision = whisper.audio.HOP_LENGTH * 2 / SAMPLE_RATE
+        segments = []
+        start = None
+        text_tokens = []
+        
+        for token in tokens:
+            if token >= tokenizer.timestamp_begin:
+                time = min((token - tokenizer.timestamp_begin) * time_precision, window_duration)
+                if start is not None and text_tokens:
+                    segments.append({"start": start, "end": time, "text": tokenizer.decode(text_tokens)})
+                    text_tokens = []
+                    start = None
+                else:
+                    start = time
+            elif token < tokenizer.eot:
+                text_tokens.append(token)
+        
+        if text_tokens:
+            segments.append({
+                "start": start if start is not None else 0.0,
+                "end": window_duration,
+                "text": tokenizer.decode(text_tokens)
+            })
+        
+        return segments
+
+class StreamingTranscription:
+    """Incremental transcription over a rolling window of streamed audio"""
+    
+    def __init__(self, transcriber: WhisperTranscriber, step_seconds: float = 5.0,
+                 window_seconds: float = 30.0, stable_margin_seconds: float = 2.0):
+        self.transcriber = transcriber
+        self.step_samples = int(step_seconds * SAMPLE_RATE)
+        self.window_samples = int(window_seconds * SAMPLE_RATE)
+        self.stable_margin = stable_margin_seconds
+        self.buffer = np.zeros(0, dtype=np.float32)  # audio not yet covered by finalized segments
+        self.buffer_offset = 0.0  # recording time of buffer[0], in seconds
+        self.pending_samples = 0
+        self.total_samples = 0
+        self.segments = []
+        self.language = None
+    
+    def add_audio(self, samples: np.ndarray):
+        """Append 16 kHz mono float32 samples to the window"""
+        self.buffer = np.concatenate([self.buffer, samples.astype(np.float32)])
+        self.pending_samples += len(samples)
+        self.total_samples += len(samples)
+    
+    def ready(self) -> bool:
+        """Whether enough new audio arrived to decode the window again"""
+        return self.pending_samples >= self.step_samples
+    
+    async def process(self, final: bool = False) -> List[Dict]:
+        """
+        Decode the current window and finalize segments that are stable
+        
+        A segment is stable once it ends at least stable_margin seconds before the end of
+        the buffered audio, so later audio can no longer change it. Finalized audio is
+        dropped from the window, keeping every decode bounded by window_seconds.
+        
+        Args:
+            final: Finalize every remaining segment because the stream has ended
+        
+        Returns:
+            List[Dict]: Newly finalized segments
+        """
+        self.pending_samples = 0
+        if len(self.buffer) == 0:
+            return []
+        
+        result = await self.transcriber.transcribe_window(self.buffer, self.buffer_offset, self.language)
+        if self.language is None:
+            self.language = result["language"]
+        
+        segments = result["segments"]
+        buffer_end = self.buffer_offset + len(self.buffer) / SAMPLE_RATE
+        
+        if final:
+            finalized = segments
+        else:
+            finalized = []
+            for segment in segments:
+                if segment["end"] > buffer_end - self.stable_margin:
+                    break
+                finalized.append(segment)
+            
+            # Keep the window bounded even when speech never pauses
+            if not finalized and len(self.buffer) > self.window_samples and len(segments) > 1:
+                finalized = segments[:-1]
+        
+        if finalized:
+            cut = finalized[-1]["end"]
+            self.buffer = self.buffer[max(0, int((cut - self.buffer_offset) * SAMPLE_RATE)):]
+            self.buffer_offset = cut
+            self.segments.extend(finalized)
+        elif not segments and len(self.buffer) > self.window_samples:
+            # Nothing but silence; keep only the tail in case speech is starting
+            keep = int(self.stable_margin * SAMPLE_RATE)
+            self.buffer_offset += (len(self.buffer) - keep) / SAMPLE_RATE
+            self.buffer = self.buffer[-keep:]
+        
+        if final:
+            self.buffer = np.zeros(0, dtype=np.float32)
+        
+        return finalized
+    
+    @property
+    def text(self) -> str:
+        return "".join(segment["text"] for segment in self.segments)
+    
+    @property
+    def duration(self) -> float:
+        return self.total_samples / SAMPLE_RATE
+
+class TranscriberRegistry:
+    """
+    Whisper model variants and the policy that routes requests between them
+    
+    Variants are named "<size>" or "<size>-int8" and are loaded lazily. Quality tiers
+    map to variants through TRANSCRIPTION_MODEL_TIERS. Without an explicit tier, short
+    recordings get the accurate tier, long ones the fast tier, and the chosen tier drops
+    one step while the queue is deeper than TRANSCRIPTION_BUSY_QUEUE_DEPTH.
+    """
+    
+    TIER_ORDER = ["fast", "balanced", "accurate"]
+    
+    def __init__(self, tiers: Dict[str, str], cache: Optional[ResultCache] = None):
+        self.tiers = tiers
+        self.cache = cache
+        self._transcribers = {}
+    
+    @staticmethod
+    def parse_tiers(spec: str) -> Dict[str, str]:
+        """Parse "fast=tiny-int8,balanced=base" into a tier -> variant mapping"""
+        tiers = {}
+        for entry in spec.split(","):
+            if "=" in entry:
+                tier, variant = entry.split("=", 1)
+                tiers[tier.strip()] = variant.strip()
+        return tiers
+    
+    def get(self, variant: str) -> WhisperTranscriber:
+        """Return the transcriber for a variant name, creating it on first use"""
+        if variant not in self._transcribers:
+            quantized = variant.endswith("-int8")
+            model_size = variant[:-len("-int8")] if quantized else variant
+            self._transcribers[variant] = WhisperTranscriber(
+                model_size, cache=self.cache, quantized=quantized
+            )
+        return self._transcribers[variant]
+    
+    @property
+    def default(self) -> WhisperTranscriber:
+        return self.get(self.tiers.get("balanced", "base"))
+    
+    def states(self) -> Dict[str, str]:
+        """Load state of every variant created so far"""
+        return {variant: t.state for variant, t in self._transcribers.items()}
+    
+    @property
+    def queue_depth(self) -> int:
+        """Requests in flight across every loaded variant"""
+        return sum(t.queue_depth for t in self._transcribers.values())
+    
+    def route(self, duration: Optional[float] = None, quality: Optional[str] = None) -> WhisperTranscriber:
+        """
+        Pick a model variant for a request
+        
+        Args:
+            duration: Audio duration in seconds, if known
+            quality: Requested quality tier; always honoured when given
+        
+        Returns:
+            WhisperTranscriber: Transcriber for the chosen variant
+        """
+        if quality is not None:
+            if quality not in self.tiers:
+                raise ValueError(f"Unknown quality tier: {quality}. Available: {', '.join(self.tiers)}")
+            return self.get(self.tiers[quality])
+        
+        if duration is not None and duration <= settings.TRANSCRIPTION_SHORT_SECONDS:
+            tier = "accurate"
+        elif duration is not None and duration >= settings.TRANSCRIPTION_LONG_SECONDS:
+            tier = "fast"
+        else:
+            tier = "balanced"
+        
+        if self.queue_depth >= settings.TRANSCRIPTION_BUSY_QUEUE_DEPTH:
+            tier = self.TIER_ORDER[max(0, self.TIER_ORDER.index(tier) - 1)]
+        
+        # Fall back through cheaper tiers when a tier is not configured
+        for candidate in reversed(self.TIER_ORDER[:self.TIER_ORDER.index(tier) + 1]):
+            if candidate in self.tiers:
+                return self.get(self.tiers[candidate])
+        return self.default
+
+# Global transcriber registry; the balanced tier serves requests that are not routed
+transcriber_registry = TranscriberRegistry(
+    TranscriberRegistry.parse_tiers(settings.TRANSCRIPTION_MODEL_TIERS),
+    cache=ResultCache(settings.TRANSCRIPTION_CACHE_DIR, settings.TRANSCRIPTION_CACHE_MAX_BYTES)
+)
 
 # Global transcriber instance
-transcriber = WhisperTranscriber()
\ No newline at end of file
+transcriber = transcriber_registry.default
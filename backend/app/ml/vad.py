@@ -0,0 +1,117 @@
+import numpy as np
+from typing import List, Tuple
+from app.ml.audio import SAMPLE_RATE
+
+def frame_energy(audio: np.ndarray, frame_length: int) -> np.ndarray:
+    """RMS energy of consecutive non-overlapping frames"""
+    n_frames = len(audio) // frame_length
+    frames = audio[:n_frames * frame_length].reshape(n_frames, frame_length)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+
+def detect_speech(audio: np.ndarray, frame_ms: int = 30, margin_db: float = 12.0,
+                  floor_db: float = -55.0, min_speech_ms: int = 150, min_silence_ms: int = 700,
+                  pad_ms: int = 200) -> List[Tuple[int, int]]:
+    """
+    Find speech regions with an adaptive energy threshold
+    
+    A frame counts as speech when it is margin_db above the recording's noise floor
+    (its 10th percentile frame energy) and above the absolute floor_db. Pauses shorter
+    than min_silence_ms are bridged, blips shorter than min_speech_ms are dropped and
+    every region is padded by pad_ms so word onsets are not clipped.
+    
+    Args:
+        audio: 16 kHz mono float32 samples
+    
+    Returns:
+        List[Tuple[int, int]]: (start, end) sample offsets of the speech regions
+    """
+    frame_length = SAMPLE_RATE * frame_ms // 1000
+    energy = frame_energy(audio, frame_length)
+    if len(energy) == 0:
+        return []
+    
+    energy_db = 20 * np.log10(energy + 1e-10)
+    noise_floor = np.percentile(energy_db, 10)
+    speech = energy_db > max(noise_floor + margin_db, floor_db)
+    
+    # Run boundaries of the speech mask
+    edges = np.diff(np.concatenate([[0], speech.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if len(starts) == 0:
+        return []
+    
+    # Bridge short pauses
+    gaps = starts[1:] - ends[:-1]
+    keep = gaps >= min_silence_ms // frame_ms
+    starts = starts[np.concatenate([[True], keep])]
+    ends = ends[np.concatenate([keep, [True]])]
+    
+    # Drop isolated blips
+    long_enough = (ends - starts) >= max(1, min_speech_ms // frame_ms)
+    starts, ends = starts[long_enough], ends[long_enough]
+    
+    pad = pad_ms * SAMPLE_RATE // 1000
+    return [
+        (max(0, int(start) * frame_length - pad), min(len(audio), int(end) * frame_length + pad))
+        for start, end in zip(starts, ends)
+    ]
+
+class SpeechMap:
+    """Concatenation of speech regions with a mapping back to the original timeline"""
+    
+    def __init__(self, regions: List[Tuple[int, int]], total_samples: int, gap_ms: int = 100):
+        # Padding may make neighbouring regions overlap; merge them first
+        merged = []
+        for start, end in regions:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        
+        self.regions = merged
+        self.total_samples = total_samples
+        self.gap = gap_ms * SAMPLE_RATE // 1000
+        
+        lengths = np.array([end - start for start, end in merged], dtype=np.int64)
+        self._original_starts = np.array([start for start, _ in merged], dtype=np.int64)
+        self._lengths = lengths
+        self._compact_starts = np.concatenate([[0], np.cumsum(lengths + self.gap)[:-1]]).astype(np.int64)
+    
+    @property
+    def speech_samples(self) -> int:
+        return int(self._lengths.sum())
+    
+    @property
+    def skipped_fraction(self) -> float:
+        if self.total_samples == 0:
+            return 0.0
+        return 1.0 - self.speech_samples / self.total_samples
+    
+    def compact(self, audio: np.ndarray) -> np.ndarray:
+        """Speech regions joined by short silent gaps"""
+        silence = np.zeros(self.gap, dtype=audio.dtype)
+        pieces = []
+        for start, end in self.regions:
+            pieces.extend([audio[start:end], silence])
+        return np.concatenate(pieces[:-1]) if pieces else np.zeros(0, dtype=audio.dtype)
+    
+    def to_original(self, seconds: float, side: str = "end") -> float:
+        """
+        Map a time on the compacted audio back to the original recording
+        
+        A time inside an inserted gap maps to the end of the preceding region, or with
+        side="start" to the start of the following one, so a segment starting in the
+        gap does not stretch over the removed silence.
+        """
+        if not self.regions:
+            return seconds
+        
+        position = int(round(seconds * SAMPLE_RATE))
+        index = max(0, int(np.searchsorted(self._compact_starts, position, side="right")) - 1)
+        within = max(0, position - self._compact_starts[index])
+        if within > self._lengths[index]:
+            if side == "start" and index + 1 < len(self.regions):
+                return float(self._original_starts[index + 1]) / SAMPLE_RATE
+            within = self._lengths[index]
+        return float(self._original_starts[index] + within) / SAMPLE_RATE
@@ -0,0 +1,39 @@
+import asyncio
+import logging
+from typing import Dict
+
+from app.ml.transcription import transcriber, transcriber_registry
+from app.ml.summarization import summarizer
+from app.ml.action_extraction import action_extractor
+
+logger = logging.getLogger(__name__)
+
+async def warmup_models():
+    """Load and prime the default models concurrently, each on its own stage executor"""
+    names = ["transcription", "summarization", "action_extraction"]
+    results = await asyncio.gather(
+        transcriber.warmup(),
+        summarizer.warmup(),
+        action_extractor.warmup(),
+        return_exceptions=True
+    )
+    
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logger.error(f"Warmup of {name} model failed: {str(result)}")
+        else:
+            logger.info(f"Warmup of {name} model completed")
+
+def model_states() -> Dict[str, str]:
+    """Load state of every model, keyed by model name"""
+    states = {f"whisper:{variant}": state for variant, state in transcriber_registry.states().items()}
+    states["summarization"] = summarizer.state
+    states["action_extraction"] = action_extractor.state
+    return states
+
+def models_ready() -> bool:
+    """Whether the default models are loaded"""
+    return all(
+        model.state == "ready"
+        for model in (transcriber, summarizer, action_extractor)
+    )
@@ -11,11 +11,21 @@ class ActionItem(BaseModel):
     text: str
     assignees: List[str] = []
     due_date: Optional[str] = None
+    due_at: Optional[datetime] = None  # due_date resolved against the meeting time
     organizations: List[str] = []
     confidence: float
     status: str = "pending"  # pending, in_progress, completed, cancelled
     priority: str = "medium"  # low, medium, high
     
+    # Where in the recording it was said, in seconds (segment-mode extraction only)
+    start: Optional[float] = None
+    end: Optional[float] = None
+    
+    # Near-duplicate detection across the user's action items
+    minhash: Optional[List[int]] = None
+    lsh_bands: Optional[List[str]] = None
+    duplicate_of: Optional[PyObjectId] = None  # open action item from an earlier meeting restating this one
+    
     # Calendar integration
     calendar_event_id: Optional[str] = None
     calendar_provider: Optional[str] = None  # google, outlook
@@ -50,10 +60,14 @@ class ActionItemResponse(BaseModel):
     text: str
     assignees: List[str]
     due_date: Optional[str]
+    due_at: Optional[datetime] = None
     organizations: List[str]
     confidence: float
     status: str
     priority: str
+    start: Optional[float] = None
+    end: Optional[float] = None
+    duplicate_of: Optional[str] = None
     calendar_event_id: Optional[str]
     calendar_provider: Optional[str]
     created_at: datetime
@@ -23,17 +23,25 @@ class Meeting(BaseModel):
     transcript: Optional[str] = None
     transcript_segments: Optional[List[TranscriptSegment]] = None
     transcript_language: Optional[str] = None
+    transcription_model: Optional[str] = None  # Whisper variant used, e.g. base or small-int8
+    transcription_offset: Optional[float] = None  # seconds of audio covered by transcript_segments
+    transcription_run_id: Optional[str] = None  # run that owns transcription while it is processing
+    transcription_heartbeat: Optional[datetime] = None  # refreshed by that run; stale once the lease expires
     transcription_status: str = "pending"  # pending, processing, completed, failed
     
     # Summarization data
     summary: Optional[str] = None
     summary_stats: Optional[Dict[str, Any]] = None
+    summary_state: Optional[Dict[str, Any]] = None  # closed chunk and group summaries for incremental updates
     summarization_status: str = "pending"  # pending, processing, completed, failed
     
     # Action items
     action_items_count: int = 0
     action_extraction_status: str = "pending"  # pending, processing, completed, failed
     
+    # Seconds spent in each processing stage, and end to end for the upload pipeline
+    processing_timings: Dict[str, float] = {}
+    
     # Metadata
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -62,8 +70,10 @@ class MeetingResponse(BaseModel):
     summary: Optional[str]
     action_items_count: int
     transcription_status: str
+    transcription_model: Optional[str] = None
     summarization_status: str
     action_extraction_status: str
+    processing_timings: Dict[str, float] = {}
     created_at: datetime
     processed_at: Optional[datetime]
     
@@ -0,0 +1,246 @@
+from typing import Dict, List, Optional
+import logging
+import time
+from datetime import datetime
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from app.core.config import settings
+from app.models.action_item import ActionItem
+from app.ml.action_extraction import action_extractor
+from app.ml.dates import resolve_due_date
+from app.ml.dedup import MinHashIndex, band_keys, minhash, same_assignees
+
+logger = logging.getLogger(__name__)
+
+OPEN_STATUSES = ["pending", "in_progress"]
+
+def build_action_items(meeting_id: ObjectId, user_id: ObjectId, extracted_items: List[Dict],
+                       meeting_time: Optional[datetime] = None) -> List[Dict]:
+    """
+    Turn extracted action items into action_items documents
+    
+    Due date phrases are resolved to due_at relative to meeting_time, or to when the
+    item was extracted if the meeting time is unknown.
+    """
+    documents = []
+    for item in extracted_items:
+        signature = minhash(item["text"])
+        extracted_at = datetime.fromisoformat(item["extracted_at"])
+        due_at = None
+        if item["due_date"]:
+            due_at = resolve_due_date(item["due_date"], meeting_time or extracted_at)
+        documents.append(ActionItem(
+            meeting_id=meeting_id,
+            user_id=user_id,
+            text=item["text"],
+            assignees=item["assignees"],
+            due_date=item["due_date"],
+            due_at=due_at,
+            organizations=item["organizations"],
+            confidence=item["confidence"],
+            start=item.get("start"),
+            end=item.get("end"),
+            minhash=signature,
+            lsh_bands=band_keys(signature),
+            extracted_at=extracted_at
+        ).dict(by_alias=True))
+    return documents
+
+async def flag_duplicates(db: AsyncIOMotorDatabase, user_id: ObjectId, documents: List[Dict]):
+    """
+    Point new action items at open action items from other meetings that restate them
+    
+    Only the user's items sharing an LSH band with a new item are read, through the
+    (user_id, lsh_bands) index, rather than all of them. Documents are checked in
+    order, so a later meeting's items can also match an earlier meeting's in the same
+    batch. duplicate_of always names the first occurrence.
+    """
+    if not documents:
+        return
+    
+    bands = sorted({band for document in documents for band in document["lsh_bands"]})
+    cursor = db["action_items"].find(
+        {"user_id": user_id, "status": {"$in": OPEN_STATUSES}, "lsh_bands": {"$in": bands}},
+        {"meeting_id": 1, "assignees": 1, "minhash": 1, "lsh_bands": 1, "duplicate_of": 1}
+    )
+    
+    index = MinHashIndex()
+    items = {}
+    async for existing in cursor:
+        index.add(existing["_id"], existing["minhash"], existing["lsh_bands"])
+        items[existing["_id"]] = existing
+    
+    for document in documents:
+        for key, _ in index.query(document["minhash"], document["lsh_bands"]):
+            match = items[key]
+            if (match["meeting_id"] != document["meeting_id"]
+                    and same_assignees(match["assignees"], document["assignees"])):
+                document["duplicate_of"] = match.get("duplicate_of") or key
+                break
+        index.add(document["_id"], document["minhash"], document["lsh_bands"])
+        items[document["_id"]] = document
+
+async def save_action_items(db: AsyncIOMotorDatabase, meeting_id: ObjectId, user_id: ObjectId,
+                            extracted_items: List[Dict], meeting_time: Optional[datetime] = None) -> List[Dict]:
+    """Insert the action items of one meeting in a single write and return the saved documents"""
+    documents = build_action_items(meeting_id, user_id, extracted_items, meeting_time)
+    await flag_duplicates(db, user_id, documents)
+    if documents:
+        await db["action_items"].insert_many(documents)
+    return documents
+
+async def extract_meeting_action_items(db: AsyncIOMotorDatabase, meeting: Dict,
+                                       mode: str = "transcript") -> List[Dict]:
+    """
+    Extract and save the action items of a meeting
+    
+    In segments mode the stored transcript segments are used, so each item gets the
+    start and end of where it was said. Sets action_extraction_status as it goes and
+    records the stage time in processing_timings. Raises on failure after marking
+    the stage failed.
+    
+    Returns:
+        List[Dict]: The saved action_items documents
+    """
+    meeting_id = meeting["_id"]
+    started = time.perf_counter()
+    
+    try:
+        # Update status to processing
+        await db["meetings"].update_one(
+            {"_id": meeting_id},
+            {"$set": {"action_extraction_status": "processing"}}
+        )
+        
+        # Extract action items
+        if mode == "segments":
+            extracted_items = await action_extractor.extract_action_items_from_segments(
+                meeting["transcript_segments"]
+            )
+        else:
+            extracted_items = await action_extractor.extract_action_items(meeting["transcript"])
+        
+        # Save action items to database
+        documents = await save_action_items(
+            db, meeting_id, meeting["user_id"], extracted_items, meeting.get("created_at")
+        )
+        
+        # Update meeting with action items count
+        await db["meetings"].update_one(
+            {"_id": meeting_id},
+            {"$set": {
+                "action_items_count": len(documents),
+                "action_extraction_status": "completed",
+                "processing_timings.action_extraction": round(time.perf_counter() - started, 3)
+            }}
+        )
+        return documents
+    
+    except Exception as e:
+        logger.error(f"Action item extraction failed for meeting {meeting_id}: {str(e)}")
+        
+        # Update status to failed
+        await db["meetings"].update_one(
+            {"_id": meeting_id},
+            {"$set": {"action_extraction_status": "failed"}}
+        )
+        raise
+
+def pending_meetings_query(user_id: Optional[ObjectId] = None,
+                           meeting_ids: Optional[List[ObjectId]] = None) -> Dict:
+    """Meetings that have a transcript but no completed action item extraction"""
+    query = {
+        "transcript": {"$nin": [None, ""]},
+        "action_extraction_status": {"$ne": "completed"}
+    }
+    if user_id is not None:
+        query["user_id"] = user_id
+    if meeting_ids is not None:
+        query["_id"] = {"$in": meeting_ids}
+    return query
+
+async def extract_bulk(
+    db: AsyncIOMotorDatabase,
+    query: Dict,
+    batch_size: int = settings.ACTION_EXTRACTION_PIPE_BATCH_SIZE,
+    n_process: int = settings.ACTION_EXTRACTION_PIPE_PROCESSES,
+    window: int = settings.ACTION_EXTRACTION_BULK_WINDOW
+) -> Dict:
+    """
+    Extract action items for every meeting matching query
+    
+    Transcripts are streamed from the meetings collection in windows. Each window goes
+    through one nlp.pipe run, then its action items are written with one insert_many and
+    the meetings are updated with one bulk_write.
+    
+    Returns:
+        Dict: Counts, elapsed seconds and throughput in meetings per second
+    """
+    stats = {"meetings": 0, "action_items": 0, "failed": 0}
+    started = time.perf_counter()
+    
+    async def process(meetings: List[Dict]):
+        meeting_ids = [meeting["_id"] for meeting in meetings]
+        try:
+            results = await action_extractor.extract_action_items_bulk(
+                [meeting["transcript"] for meeting in meetings],
+                batch_size=batch_size,
+                n_process=n_process
+            )
+            
+            documents = []
+            by_user = {}
+            updates = []
+            for meeting, extracted_items in zip(meetings, results):
+                meeting_documents = build_action_items(
+                    meeting["_id"], meeting["user_id"], extracted_items, meeting.get("created_at")
+                )
+                documents.extend(meeting_documents)
+                by_user.setdefault(meeting["user_id"], []).extend(meeting_documents)
+                updates.append(UpdateOne(
+                    {"_id": meeting["_id"]},
+                    {"$set": {
+                        "action_items_count": len(extracted_items),
+                        "action_extraction_status": "completed"
+                    }}
+                ))
+            
+            for user_id, user_documents in by_user.items():
+                await flag_duplicates(db, user_id, user_documents)
+            
+            if documents:
+                await db["action_items"].insert_many(documents, ordered=False)
+            await db["meetings"].bulk_write(updates, ordered=False)
+            
+            stats["meetings"] += len(meetings)
+            stats["action_items"] += len(documents)
+        
+        except Exception as e:
+            logger.error(f"Bulk action item extraction failed for {len(meetings)} meetings: {str(e)}")
+            await db["meetings"].update_many(
+                {"_id": {"$in": meeting_ids}},
+                {"$set": {"action_extraction_status": "failed"}}
+            )
+            stats["failed"] += len(meetings)
+    
+    # Oldest first, so restated items point at the meeting that raised them first
+    cursor = db["meetings"].find(
+        query, {"transcript": 1, "user_id": 1, "created_at": 1}
+    ).sort("created_at", 1).batch_size(window)
+    meetings = []
+    async for meeting in cursor:
+        meetings.append(meeting)
+        if len(meetings) >= window:
+            await process(meetings)
+            meetings = []
+    if meetings:
+        await process(meetings)
+    
+    stats["seconds"] = round(time.perf_counter() - started, 3)
+    stats["meetings_per_second"] = round(stats["meetings"] / stats["seconds"], 2) if stats["seconds"] else 0.0
+    logger.info(
+        f"Bulk extracted {stats['action_items']} action items from {stats['meetings']} meetings "
+        f"in {stats['seconds']}s ({stats['meetings_per_second']} meetings/s)"
+    )
+    return stats
@@ -0,0 +1,77 @@
+from typing import Awaitable, Callable, Dict, Optional
+import logging
+import time
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.ml.summarization import summarizer
+
+logger = logging.getLogger(__name__)
+
+async def summarize_meeting_transcript(
+    db: AsyncIOMotorDatabase,
+    meeting: Dict,
+    max_length: int = 150,
+    min_length: int = 50,
+    mode: str = "abstractive",
+    incremental: bool = False,
+    on_progress: Optional[Callable[[str, Dict], Awaitable[None]]] = None
+) -> Dict:
+    """
+    Summarize a meeting's transcript and store the summary on the meeting
+    
+    Incremental runs only summarize the part of the transcript added since the last
+    incremental run. Sets summarization_status as it goes and records the stage time
+    in processing_timings. Raises on failure after marking the stage failed.
+    
+    Returns:
+        Dict: Summarization result as returned by the summarizer
+    """
+    meeting_id = meeting["_id"]
+    started = time.perf_counter()
+    
+    try:
+        # Update status to processing
+        await db["meetings"].update_one(
+            {"_id": meeting_id},
+            {"$set": {"summarization_status": "processing"}}
+        )
+        
+        # Perform summarization
+        update = {}
+        if incremental and mode == "abstractive":
+            result, update["summary_state"] = await summarizer.summarize_incremental(
+                meeting["transcript"],
+                meeting.get("summary_state"),
+                max_length=max_length,
+                min_length=min_length
+            )
+        else:
+            result = await summarizer.summarize_transcript(
+                meeting["transcript"],
+                max_length=max_length,
+                min_length=min_length,
+                mode=mode,
+                on_progress=on_progress
+            )
+        
+        # Update meeting with summary
+        await db["meetings"].update_one(
+            {"_id": meeting_id},
+            {"$set": {
+                "summary": result["summary"],
+                "summary_stats": result,
+                "summarization_status": "completed",
+                "processing_timings.summarization": round(time.perf_counter() - started, 3),
+                **update
+            }}
+        )
+        return result
+    
+    except Exception as e:
+        logger.error(f"Summarization failed for meeting {meeting_id}: {str(e)}")
+        
+        # Update status to failed
+        await db["meetings"].update_one(
+            {"_id": meeting_id},
+            {"$set": {"summarization_status": "failed"}}
+        )
+        raise
@@ -0,0 +1,163 @@
+from typing import Dict, Optional
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.core.config import settings
+from app.ml.transcription import TranscriptionInProgress, transcriber_registry
+from app.ml.audio import audio_duration
+
+logger = logging.getLogger(__name__)
+
+def lease_held(meeting: Dict, now: Optional[datetime] = None) -> bool:
+    """Whether a live run is transcribing the meeting"""
+    heartbeat = meeting.get("transcription_heartbeat")
+    if meeting.get("transcription_status") != "processing" or heartbeat is None:
+        return False
+    now = now or datetime.utcnow()
+    return heartbeat > now - timedelta(seconds=settings.TRANSCRIPTION_LEASE_SECONDS)
+
+async def transcribe_meeting_audio(db: AsyncIOMotorDatabase, meeting: Dict, quality: Optional[str] = None) -> Dict:
+    """
+    Transcribe a meeting's audio and store the transcript on the meeting
+    
+    An interrupted run resumes from its last checkpoint with the same model variant.
+    A run owns the meeting through transcription_run_id and keeps the lease alive by
+    refreshing transcription_heartbeat. Only a run whose lease has gone stale counts
+    as interrupted. While another run holds the lease, TranscriptionInProgress is
+    raised.
+    
+    Sets transcription_status as it goes and records the stage time in
+    processing_timings. Raises on failure after marking the stage failed.
+    
+    Returns:
+        Dict: Transcript, segments, language, model and where the run resumed from
+    """
+    meeting_id = meeting["_id"]
+    started = time.perf_counter()
+    run_id = uuid.uuid4().hex
+    owned = {"_id": meeting_id, "transcription_run_id": run_id}
+    heartbeat_task = None
+    
+    now = datetime.utcnow()
+    if lease_held(meeting, now):
+        raise TranscriptionInProgress(f"Meeting {meeting_id} is already being transcribed")
+    
+    try:
+        start_offset = meeting.get("transcription_offset") or 0.0
+        resume = (
+            meeting.get("transcription_status") in ("processing", "failed")
+            and start_offset > 0
+            and meeting.get("transcription_model") is not None
+            and (quality is None or transcriber_registry.tiers[quality] == meeting["transcription_model"])
+        )
+        
+        if resume:
+            model = transcriber_registry.get(meeting["transcription_model"])
+            previous_segments = meeting.get("transcript_segments") or []
+            logger.info(f"Resuming transcription of meeting {meeting_id} at {start_offset:.1f}s")
+        else:
+            # Pick the model variant from duration, requested tier and load
+            duration = meeting.get("duration")
+            if duration is None:
+                loop = asyncio.get_event_loop()
+                duration = await loop.run_in_executor(None, audio_duration, meeting["audio_file_path"])
+            model = transcriber_registry.route(duration, quality)
+            start_offset = 0.0
+            previous_segments = []
+        
+        # Take the lease, unless another run took it since the meeting was read
+        update = {
+            "transcription_status": "processing",
+            "transcription_model": model.name,
+            "transcription_run_id": run_id,
+            "transcription_heartbeat": now
+        }
+        if not resume:
+            update.update({"transcript_segments": [], "transcription_offset": 0.0})
+        claimed = await db["meetings"].update_one(
+            {
+                "_id": meeting_id,
+                "transcription_run_id": meeting.get("transcription_run_id"),
+                "$or": [
+                    {"transcription_status": {"$ne": "processing"}},
+                    {"transcription_heartbeat": None},
+                    {"transcription_heartbeat": {"$lte": now - timedelta(seconds=settings.TRANSCRIPTION_LEASE_SECONDS)}}
+                ]
+            },
+            {"$set": update}
+        )
+        if claimed.matched_count == 0:
+            raise TranscriptionInProgress(f"Meeting {meeting_id} is already being transcribed")
+        
+        async def heartbeat():
+            while True:
+                await asyncio.sleep(settings.TRANSCRIPTION_LEASE_SECONDS / 3)
+                await db["meetings"].update_one(owned, {"$set": {"transcription_heartbeat": datetime.utcnow()}})
+        
+        heartbeat_task = asyncio.create_task(heartbeat())
+        
+        async def save_checkpoint(segments, offset):
+            saved = await db["meetings"].update_one(
+                owned,
+                {
+                    "$push": {"transcript_segments": {"$each": segments}},
+                    "$set": {
+                        "transcription_offset": offset,
+                        "transcription_heartbeat": datetime.utcnow(),
+                        "updated_at": datetime.utcnow()
+                    }
+                }
+            )
+            if saved.matched_count == 0:
+                raise TranscriptionInProgress(f"Meeting {meeting_id} was taken over by another run")
+        
+        # Perform transcription
+        result = await model.transcribe_audio(
+            meeting["audio_file_path"], start_offset=start_offset, on_checkpoint=save_checkpoint
+        )
+        segments = previous_segments + result["segments"]
+        transcript = "".join(segment["text"] for segment in segments).strip() if resume else result["text"]
+        
+        # Update meeting with transcription results
+        saved = await db["meetings"].update_one(
+            owned,
+            {"$set": {
+                "transcript": transcript,
+                "transcript_segments": segments,
+                "transcript_language": result["language"],
+                "transcription_model": model.name,
+                "transcription_offset": result["duration"],
+                "duration": result["duration"],
+                "transcription_status": "completed",
+                "processing_timings.transcription": round(time.perf_counter() - started, 3)
+            }}
+        )
+        if saved.matched_count == 0:
+            raise TranscriptionInProgress(f"Meeting {meeting_id} was taken over by another run")
+        
+        return {
+            "transcript": transcript,
+            "resumed_from": start_offset,
+            "language": result["language"],
+            "model": model.name,
+            "segments": segments,
+            "skipped_fraction": result["skipped_fraction"],
+            "cached": result["cached"]
+        }
+    
+    except TranscriptionInProgress:
+        raise
+    
+    except Exception as e:
+        logger.error(f"Transcription failed for meeting {meeting_id}: {str(e)}")
+        
+        # Update status to failed, unless the meeting belongs to another run by now
+        await db["meetings"].update_one(owned, {"$set": {"transcription_status": "failed"}})
+        raise
+    
+    finally:
+        if heartbeat_task is not None:
+            heartbeat_task.cancel()
@@ -0,0 +1,66 @@
+"""
+Compare single-pass action extraction with per-sentence re-parsing on a golden set
+
+The reference re-runs spaCy on every candidate sentence, the way extraction used to.
+Prints every transcript whose action items differ and exits non-zero if any do.
+
+Usage (from backend/):
+    python -m scripts.action_extraction_golden transcripts/*.txt
+"""
+import argparse
+import json
+import sys
+import time
+
+from app.ml.action_extraction import ActionItemExtractor
+
+def comparable(actions):
+    return [{key: value for key, value in action.items() if key != "extracted_at"} for action in actions]
+
+def reference_extract(extractor: ActionItemExtractor, transcript: str):
+    """Per-sentence re-parsing: each candidate sentence gets its own Doc"""
+    doc = extractor.nlp(transcript)
+    action_items = []
+    for sent in doc.sents:
+        sentence = sent.text.strip()
+        if extractor._contains_action_keywords(sentence):
+            action_item = extractor._process_action_sentence(extractor.nlp(sentence)[:], sentence)
+            if action_item:
+                action_items.append(action_item)
+    unique_actions = extractor._deduplicate_actions(action_items)
+    return sorted(unique_actions, key=lambda x: x['confidence'], reverse=True)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("transcripts", nargs="+", help="Plain text transcript files")
+    args = parser.parse_args()
+    
+    extractor = ActionItemExtractor()
+    import spacy
+    extractor.nlp = spacy.load(extractor.model_name)
+    
+    mismatches = 0
+    reference_seconds = single_pass_seconds = 0.0
+    for path in args.transcripts:
+        with open(path, "r", encoding="utf-8") as f:
+            transcript = f.read()
+        
+        started = time.perf_counter()
+        expected = comparable(reference_extract(extractor, transcript))
+        reference_seconds += time.perf_counter() - started
+        
+        started = time.perf_counter()
+        actual = comparable(extractor._extract_sync(transcript))
+        single_pass_seconds += time.perf_counter() - started
+        
+        if actual != expected:
+            mismatches += 1
+            print(f"MISMATCH {path}")
+            print(json.dumps({"expected": expected, "actual": actual}, indent=2))
+    
+    print(f"{len(args.transcripts)} transcripts, {mismatches} mismatches")
+    print(f"re-parsing: {reference_seconds:.2f}s, single pass: {single_pass_seconds:.2f}s")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == "__main__":
+    main()
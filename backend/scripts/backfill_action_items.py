@@ -0,0 +1,47 @@
+"""
+Backfill action items for meetings that have a transcript but no extracted action items
+
+Transcripts are streamed from MongoDB and parsed with nlp.pipe; action items are
+bulk-written per window of meetings. Prints throughput in meetings per second.
+
+Usage (from backend/):
+    python -m scripts.backfill_action_items [--user USER_ID] [--batch-size 64] [--n-process 4]
+"""
+import argparse
+import asyncio
+import json
+
+from bson import ObjectId
+
+from app.core.config import settings
+from app.core.database import db, connect_to_mongo, close_mongo_connection
+from app.services.action_items import extract_bulk, pending_meetings_query
+
+async def backfill(args):
+    await connect_to_mongo()
+    try:
+        user_id = ObjectId(args.user) if args.user else None
+        return await extract_bulk(
+            db.database,
+            pending_meetings_query(user_id),
+            batch_size=args.batch_size,
+            n_process=args.n_process,
+            window=args.window
+        )
+    finally:
+        await close_mongo_connection()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--user", help="Only backfill this user's meetings")
+    parser.add_argument("--batch-size", type=int, default=settings.ACTION_EXTRACTION_PIPE_BATCH_SIZE)
+    parser.add_argument("--n-process", type=int, default=settings.ACTION_EXTRACTION_PIPE_PROCESSES)
+    parser.add_argument("--window", type=int, default=settings.ACTION_EXTRACTION_BULK_WINDOW,
+                        help="Meetings read, parsed and written per round")
+    args = parser.parse_args()
+    
+    stats = asyncio.run(backfill(args))
+    print(json.dumps(stats, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Microbenchmark action-item sentence scanning: per-keyword substring checks and
+per-sentence regexes vs the compiled single-pass SentenceMatcher
+
+Usage (from backend/):
+    python -m scripts.benchmark_action_matchers [transcripts/*.txt] [--repeat 5]
+
+Without transcript files a synthetic corpus is generated.
+"""
+import argparse
+import random
+import re
+import time
+
+from app.ml.action_extraction import ActionItemExtractor
+from app.ml.extractive import split_sentences
+
+def legacy_scan(extractor: ActionItemExtractor, sentence: str):
+    """The previous scoring inputs: several scans over the keyword list plus four regexes"""
+    sentence_lower = sentence.lower()
+    if not any(keyword in sentence_lower for keyword in extractor.action_keywords):
+        return None
+    dates = []
+    for pattern in extractor.date_patterns:
+        dates.extend(match.group() for match in re.finditer(pattern, sentence, re.IGNORECASE))
+    count = sum(1 for keyword in extractor.action_keywords if keyword in sentence_lower)
+    imperative = any(word in sentence_lower for word in ["must", "will", "should", "need"])
+    return count, dates, imperative
+
+def compiled_scan(extractor: ActionItemExtractor, sentence: str):
+    match = extractor.matcher.scan(sentence)
+    if not match.keywords:
+        return None
+    return len(match.keywords), match.dates, match.imperative
+
+def synthetic_corpus(n_sentences: int = 200000):
+    random.seed(0)
+    fillers = "we the project team discussed budget numbers design release customer feedback and then".split()
+    phrases = ["will", "need to", "should", "follow up", "by friday", "before 12/05", "next week", "due march 3"]
+    sentences = []
+    for _ in range(n_sentences):
+        words = random.choices(fillers, k=random.randint(6, 18))
+        if random.random() < 0.4:
+            words.insert(random.randrange(len(words)), random.choice(phrases))
+        sentences.append(" ".join(words).capitalize() + ".")
+    return sentences
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("transcripts", nargs="*", help="Plain text transcript files")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    if args.transcripts:
+        sentences = []
+        for path in args.transcripts:
+            with open(path, "r", encoding="utf-8") as f:
+                sentences.extend(split_sentences(f.read()))
+    else:
+        sentences = synthetic_corpus()
+    
+    extractor = ActionItemExtractor()
+    print(f"{len(sentences)} sentences")
+    
+    for name, scan in [("legacy", legacy_scan), ("compiled", compiled_scan)]:
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            for sentence in sentences:
+                scan(extractor, sentence)
+            timings.append(time.perf_counter() - started)
+        best = min(timings)
+        print(f"{name:>9}: best {best:.3f}s ({len(sentences) / best:,.0f} sentences/s)")
+
+if __name__ == "__main__":
+    main()
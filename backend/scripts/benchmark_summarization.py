@@ -0,0 +1,51 @@
+"""
+Compare per-meeting summarization wall time: one pipeline call per chunk vs batched
+
+Usage (from backend/):
+    python -m scripts.benchmark_summarization transcript.txt [--runs 3]
+"""
+import argparse
+import asyncio
+import time
+
+from app.core.config import settings
+from app.ml.summarization import MeetingSummarizer
+
+def sequential(summarizer: MeetingSummarizer, chunks, max_length: int, min_length: int):
+    """The previous behaviour: one forward pass per chunk"""
+    return [
+        summarizer.summarizer(
+            chunk, max_length=max_length, min_length=min_length, do_sample=False, truncation=True
+        )[0]['summary_text']
+        for chunk in chunks
+    ]
+
+def batched(summarizer: MeetingSummarizer, chunks, max_length: int, min_length: int):
+    return summarizer._summarize_batch(chunks, (max_length, min_length))
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("transcript", help="Path to a plain text transcript")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-length", type=int, default=150)
+    parser.add_argument("--min-length", type=int, default=50)
+    args = parser.parse_args()
+    
+    with open(args.transcript, "r", encoding="utf-8") as f:
+        transcript = f.read()
+    
+    summarizer = MeetingSummarizer()
+    await summarizer.load_model()
+    chunks = summarizer._split_text(transcript)
+    print(f"{len(transcript.split())} words, {len(chunks)} chunks, batch size {settings.SUMMARIZATION_BATCH_SIZE}")
+    
+    for name, run in [("sequential", sequential), ("batched", batched)]:
+        timings = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            run(summarizer, chunks, args.max_length, args.min_length)
+            timings.append(time.perf_counter() - started)
+        print(f"{name:>10}: best {min(timings):.2f}s, mean {sum(timings) / len(timings):.2f}s")
+
+if __name__ == "__main__":
+    asyncio.run(main())
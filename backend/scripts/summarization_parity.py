@@ -0,0 +1,70 @@
+"""
+Check an optimized summarization backend against the fp32 torch baseline
+
+Summarizes each transcript chunk with both backends and reports unigram F1 overlap
+between the summaries, plus wall time. Exits non-zero when mean overlap falls
+below --min-overlap.
+
+Usage (from backend/):
+    python -m scripts.summarization_parity transcript.txt --backend torch-int8
+"""
+import argparse
+import re
+import sys
+import time
+from collections import Counter
+
+from app.core.config import settings
+from app.ml.summarization import MeetingSummarizer, SUMMARIZATION_BACKENDS
+
+def unigram_f1(reference: str, candidate: str) -> float:
+    """ROUGE-1 style F1 between two texts"""
+    reference_words = Counter(re.findall(r"\w+", reference.lower()))
+    candidate_words = Counter(re.findall(r"\w+", candidate.lower()))
+    overlap = sum((reference_words & candidate_words).values())
+    if overlap == 0:
+        return 0.0
+    precision = overlap / sum(candidate_words.values())
+    recall = overlap / sum(reference_words.values())
+    return 2 * precision * recall / (precision + recall)
+
+def summarize(summarizer: MeetingSummarizer, chunks, max_length: int, min_length: int):
+    started = time.perf_counter()
+    summaries = summarizer._summarize_batch(chunks, (max_length, min_length))
+    return summaries, time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("transcript", help="Path to a plain text transcript")
+    parser.add_argument("--backend", choices=SUMMARIZATION_BACKENDS, default=settings.SUMMARIZATION_BACKEND)
+    parser.add_argument("--max-length", type=int, default=150)
+    parser.add_argument("--min-length", type=int, default=50)
+    parser.add_argument("--min-overlap", type=float, default=0.6)
+    args = parser.parse_args()
+    
+    with open(args.transcript, "r", encoding="utf-8") as f:
+        transcript = f.read()
+    
+    baseline = MeetingSummarizer(backend="torch", model_dir=settings.SUMMARIZATION_MODEL_DIR)
+    candidate = MeetingSummarizer(backend=args.backend, model_dir=settings.SUMMARIZATION_MODEL_DIR)
+    baseline.tokenizer, baseline.model, baseline.summarizer = baseline._load_model_sync()
+    candidate.tokenizer, candidate.model, candidate.summarizer = candidate._load_model_sync()
+    
+    chunks = baseline._split_text(transcript)
+    reference, baseline_seconds = summarize(baseline, chunks, args.max_length, args.min_length)
+    summaries, candidate_seconds = summarize(candidate, chunks, args.max_length, args.min_length)
+    
+    scores = [unigram_f1(expected, actual) for expected, actual in zip(reference, summaries)]
+    for index, score in enumerate(scores):
+        print(f"chunk {index}: overlap {score:.3f}")
+    
+    mean = sum(scores) / len(scores) if scores else 0.0
+    print(f"{len(chunks)} chunks, mean overlap {mean:.3f}")
+    print(f"torch: {baseline_seconds:.2f}s, {args.backend}: {candidate_seconds:.2f}s")
+    
+    if mean < args.min_overlap:
+        print(f"Mean overlap below {args.min_overlap}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
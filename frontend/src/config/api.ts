@@ -19,6 +19,7 @@ export const API_ENDPOINTS = {
   
   // Summarization
   SUMMARIZE_MEETING: (id: string) => `/api/summarization/summarize/${id}`,
+  SUMMARIZE_MEETING_STREAM: (id: string) => `/api/summarization/summarize/${id}/stream`,
   SUMMARIZE_TEXT: '/api/summarization/summarize-text',
   SUMMARY: (id: string) => `/api/summarization/${id}/summary`,
   
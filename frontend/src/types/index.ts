@@ -31,6 +31,7 @@ export interface Meeting {
   transcription_status: 'pending' | 'processing' | 'completed' | 'failed';
   summarization_status: 'pending' | 'processing' | 'completed' | 'failed';
   action_extraction_status: 'pending' | 'processing' | 'completed' | 'failed';
+  processing_timings?: Record<string, number>;
   created_at: string;
   processed_at?: string;
 }
@@ -69,10 +70,14 @@ export interface ActionItem {
   text: string;
   assignees: string[];
   due_date?: string;
+  due_at?: string;
   organizations: string[];
   confidence: number;
   status: 'pending' | 'in_progress' | 'completed' | 'cancelled';
   priority: 'low' | 'medium' | 'high';
+  start?: number;
+  end?: number;
+  duplicate_of?: string;
   calendar_event_id?: string;
   calendar_provider?: string;
   created_at: string;